@@ -2,23 +2,54 @@
 colab_converter.py — PDF, CBZ (with ComicInfo.xml), and raw Images output
 """
 
+import asyncio
 import io
 import os
+import time
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from xml.dom import minidom
 
 from PIL import Image
-from fpdf import FPDF
+
+FOLDER_WRITE_WORKERS = 8   # parallel file writes in images_to_folder
+
+
+# ---------------------------------------------------------------------------
+# Format sniffing
+# ---------------------------------------------------------------------------
+
+def _sniff_ext(img_bytes: bytes) -> str:
+    """
+    Return the file extension for raw image bytes by checking magic numbers.
+    Falls back to PIL (header parse only, no pixel decode) for anything else.
+    """
+    if img_bytes[:3] == b"\xff\xd8\xff":
+        return "jpg"
+    if img_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if img_bytes[:4] == b"RIFF" and img_bytes[8:12] == b"WEBP":
+        return "webp"
+    if img_bytes[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    fmt = Image.open(io.BytesIO(img_bytes)).format or "JPEG"
+    return fmt.lower().replace("jpeg", "jpg")
 
 
 # ---------------------------------------------------------------------------
 # ComicInfo.xml  (ComicRack / Kavita / Komga / CDisplayEx standard)
 # ---------------------------------------------------------------------------
 
-def build_comic_info_xml(manga_info: dict, chapter_number: int, total_chapters: int) -> str:
-    """Return a pretty-printed ComicInfo.xml string."""
+_NUMBER_SLOT = "<Number>{NUMBER}</Number>"
+_COUNT_SLOT  = "<Count>{COUNT}</Count>"
+
+
+def build_comic_info_template(manga_info: dict) -> str:
+    """
+    Serialise the series-level ComicInfo.xml once.
+    Chapter Number / Count are left as placeholders for render_comic_info().
+    """
     root = ET.Element("ComicInfo")
     root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
     root.set("xmlns:xsd", "http://www.w3.org/2001/XMLSchema")
@@ -30,8 +61,8 @@ def build_comic_info_xml(manga_info: dict, chapter_number: int, total_chapters:
 
     add("Title",       manga_info.get("title", ""))
     add("Series",      manga_info.get("title", ""))
-    add("Number",      str(chapter_number))
-    add("Count",       str(total_chapters))
+    add("Number",      "{NUMBER}")
+    add("Count",       "{COUNT}")
     add("Writer",      ", ".join(manga_info.get("authors", [])))
     add("Summary",     manga_info.get("description", ""))
     add("Year",        manga_info.get("released", ""))
@@ -40,97 +71,295 @@ def build_comic_info_xml(manga_info: dict, chapter_number: int, total_chapters:
     add("LanguageISO", "en")
     add("Manga",       "Yes")
 
-    raw      = ET.tostring(root, encoding="unicode")
-    reparsed = minidom.parseString(raw)
-    return reparsed.toprettyxml(indent="  ", encoding=None)
+    return '<?xml version="1.0" ?>\n' + ET.tostring(root, encoding="unicode")
+
+
+def render_comic_info(template: str, chapter_number: int, total_chapters: int) -> str:
+    """Fill a template from build_comic_info_template() for one chapter."""
+    return (
+        template
+        .replace(_NUMBER_SLOT, f"<Number>{chapter_number}</Number>")
+        .replace(_COUNT_SLOT,  f"<Count>{total_chapters}</Count>")
+    )
+
+
+def build_comic_info_xml(manga_info: dict, chapter_number: int, total_chapters: int) -> str:
+    """Return a ComicInfo.xml string for one chapter."""
+    return render_comic_info(
+        build_comic_info_template(manga_info), chapter_number, total_chapters
+    )
 
 
 # ---------------------------------------------------------------------------
 # PDF
 # ---------------------------------------------------------------------------
 
-def images_to_pdf(image_bytes_list: list, output_path: str) -> None:
-    """Convert a list of raw image bytes into a single PDF file."""
-    pdf = FPDF()
-    pdf.set_auto_page_break(False)
+# Modes Pillow's PDF writer embeds as-is; anything else (RGBA, P, …) is converted
+_PDF_NATIVE_MODES = ("RGB", "L", "CMYK", "1")
+
+# JPEG quality for the DCTDecode streams Pillow writes (its default is 75)
+PDF_JPEG_QUALITY = 90
+
+# Decoded pages held at once; each batch is written (appended) with one save()
+PDF_PAGE_BATCH = 8
 
+# Every page is this wide (A4 width, as the old fpdf layout used); height follows the aspect
+PDF_PAGE_WIDTH_MM = 210.0
+
+
+def _open_pdf_page(img_bytes: bytes) -> Image.Image:
+    """
+    Decode one page, converting it only if the PDF writer can't take its mode.
+    Raises for a broken or truncated image, so the caller can skip that page.
+    """
+    img = Image.open(io.BytesIO(img_bytes))
+    img.load()
+    if img.mode not in _PDF_NATIVE_MODES:
+        img = img.convert("RGB")
+    return img
+
+
+def _write_pdf_batch(pages: list, output_path: str, append: bool) -> None:
+    """
+    Write same-width decoded pages to the PDF, creating it or appending to it,
+    then free them. The resolution maps their pixel width onto PDF_PAGE_WIDTH_MM.
+    """
+    try:
+        pages[0].save(
+            output_path, "PDF",
+            save_all=True,
+            append_images=pages[1:],
+            append=append,
+            resolution=pages[0].width * 25.4 / PDF_PAGE_WIDTH_MM,
+            quality=PDF_JPEG_QUALITY,
+        )
+    finally:
+        # save() leaves the pages referencing each other through encoderinfo,
+        # so release the bitmaps now rather than whenever the cycle is collected
+        for page in pages:
+            page.close()
+
+
+def images_to_pdf(image_bytes_list: list, output_path: str) -> None:
+    """
+    Convert a list of raw image bytes into a single PDF file.
+    Uses Pillow's multi-page PDF writer directly (no fpdf layout pass);
+    Pillow re-encodes each page as JPEG at PDF_JPEG_QUALITY. Each page is
+    decoded once, which is also the check — a page that fails is skipped —
+    and written in batches of up to PDF_PAGE_BATCH same-width pages, so peak
+    memory stays at one batch of bitmaps rather than the whole chapter.
+    Pages that are already RGB/greyscale skip the .convert("RGB") copy.
+    """
+    batch   = []
+    written = False
     for img_bytes in image_bytes_list:
         if not img_bytes:
             continue
         try:
-            img   = Image.open(io.BytesIO(img_bytes)).convert("RGB")
-            w, h  = img.size
-            pdf_w = 210.0
-            pdf_h = round(h * pdf_w / w, 2)
-            pdf.add_page(format=(pdf_w, pdf_h))
-
-            buf = io.BytesIO()
-            img.save(buf, format="JPEG", quality=90)
-            buf.seek(0)
-            pdf.image(buf, x=0, y=0, w=pdf_w, h=pdf_h, type="JPEG")
+            page = _open_pdf_page(img_bytes)
         except Exception as e:
             print(f"    ⚠️  Skipped broken image in PDF: {e}")
+            continue
+        # A batch shares one resolution, so a new page width starts a new batch
+        if batch and (len(batch) == PDF_PAGE_BATCH or page.width != batch[0].width):
+            _write_pdf_batch(batch, output_path, append=written)
+            written = True
+            batch   = []
+        batch.append(page)
 
-    pdf.output(output_path)
+    if batch:
+        _write_pdf_batch(batch, output_path, append=written)
 
 
 # ---------------------------------------------------------------------------
 # CBZ
 # ---------------------------------------------------------------------------
 
+def _chapter_comic_info(
+    manga_info: dict,
+    chapter_number: int,
+    total_chapters: int,
+    template: str | None,
+) -> str:
+    if template is None:
+        template = build_comic_info_template(manga_info)
+    return render_comic_info(template, chapter_number, total_chapters)
+
+
+def _write_cbz_page(
+    zf: zipfile.ZipFile,
+    page_num: int,
+    img_bytes: bytes,
+    date_time: tuple,
+) -> bool:
+    """
+    Write one page into an open CBZ. Returns False if the image was skipped.
+    The entry header is prebuilt as STORED with its size known up front, so
+    zipfile does a single zlib.crc32 pass over the buffer and streams it
+    straight to disk through zf.open() — no intermediate copy of the page.
+    """
+    try:
+        ext   = _sniff_ext(img_bytes)
+        zinfo = zipfile.ZipInfo(f"{str(page_num).zfill(4)}.{ext}", date_time=date_time)
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size     = len(img_bytes)
+        with zf.open(zinfo, "w") as zw:
+            zw.write(memoryview(img_bytes))
+        return True
+    except Exception as e:
+        print(f"    ⚠️  Skipped broken image in CBZ: {e}")
+        return False
+
+
 def images_to_cbz(
     image_bytes_list: list,
     output_path: str,
     manga_info: dict,
     chapter_number: int,
     total_chapters: int,
+    comic_info_template: str | None = None,
 ) -> None:
-    """Pack images + ComicInfo.xml into a CBZ archive."""
-    comic_info = build_comic_info_xml(manga_info, chapter_number, total_chapters)
+    """
+    Pack images + ComicInfo.xml into a CBZ archive.
+    Pages are already JPEG/PNG/WebP compressed, so entries are STORED —
+    DEFLATE would burn CPU for <1% size gain.
+    Pass `comic_info_template` (see build_comic_info_template) to skip
+    rebuilding the series XML for every chapter.
+    """
+    comic_info = _chapter_comic_info(
+        manga_info, chapter_number, total_chapters, comic_info_template
+    )
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_STORED) as zf:
         zf.writestr("ComicInfo.xml", comic_info)   # must be first for most readers
 
+        stamp    = time.localtime()[:6]
         page_num = 1
         for img_bytes in image_bytes_list:
-            if not img_bytes:
-                continue
-            try:
-                img = Image.open(io.BytesIO(img_bytes))
-                fmt = img.format or "JPEG"
-                ext = fmt.lower().replace("jpeg", "jpg")
-                buf = io.BytesIO()
-                img.save(buf, format=fmt)
-                zf.writestr(f"{str(page_num).zfill(4)}.{ext}", buf.getvalue())
+            if img_bytes and _write_cbz_page(zf, page_num, img_bytes, stamp):
                 page_num += 1
-            except Exception as e:
-                print(f"    ⚠️  Skipped broken image in CBZ: {e}")
+
+
+async def stream_images_to_cbz(
+    pages,
+    output_path: str,
+    manga_info: dict,
+    chapter_number: int,
+    total_chapters: int,
+    comic_info_template: str | None = None,
+) -> int:
+    """
+    Streaming variant of images_to_cbz.
+
+    `pages` is an async iterable of (page_index, bytes | None) in any order.
+    Each page is written as soon as every earlier page has arrived, so only
+    the out-of-order window is held in memory instead of the whole chapter.
+    Writes run in a worker thread so downloads keep flowing meanwhile.
+    Returns the number of pages written.
+    """
+    comic_info = _chapter_comic_info(
+        manga_info, chapter_number, total_chapters, comic_info_template
+    )
+    pending  = {}     # page_index → bytes, waiting for earlier pages
+    next_idx = 0
+    page_num = 1
+    stamp    = time.localtime()[:6]
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("ComicInfo.xml", comic_info)   # must be first for most readers
+
+        async for idx, img_bytes in pages:
+            pending[idx] = img_bytes
+            del img_bytes
+            while next_idx in pending:
+                page = pending.pop(next_idx)
+                next_idx += 1
+                if page and await asyncio.to_thread(
+                    _write_cbz_page, zf, page_num, page, stamp
+                ):
+                    page_num += 1
+                del page      # drop the last reference as soon as it's on disk
+
+    return page_num - 1
 
 
 # ---------------------------------------------------------------------------
 # Raw images folder
 # ---------------------------------------------------------------------------
 
+def _write_page_file(output_dir: str, page_num: int, img_bytes: bytes) -> bool:
+    """Write one page to disk in a single unbuffered write."""
+    try:
+        ext = _sniff_ext(img_bytes)
+        out = os.path.join(output_dir, f"{str(page_num).zfill(4)}.{ext}")
+        with open(out, "wb", buffering=0) as f:
+            f.write(img_bytes)
+        return True
+    except Exception as e:
+        print(f"    ⚠️  Skipped broken image on save: {e}")
+        return False
+
+
 def images_to_folder(image_bytes_list: list, output_dir: str) -> int:
     """
     Save raw images into a folder, one file per page.
+    Writes are spread over a few threads so they overlap on slow
+    network-attached disks (e.g. Colab's Drive mount).
     Returns the number of pages successfully saved.
     """
     Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    pages = [
+        (page_num, img_bytes)
+        for page_num, img_bytes in enumerate(image_bytes_list, start=1)
+        if img_bytes
+    ]
+    with ThreadPoolExecutor(max_workers=FOLDER_WRITE_WORKERS) as pool:
+        results = pool.map(lambda p: _write_page_file(output_dir, *p), pages)
+        return sum(results)
+
+
+async def stream_images_to_folder(pages, output_dir: str) -> int:
+    """
+    Streaming variant of images_to_folder.
+
+    `pages` is an async iterable of (page_index, bytes | None) in any order.
+    File names come from the page index, so each page is written (in a
+    worker thread) the moment it arrives. Returns the number of pages saved.
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
     saved = 0
 
-    for page_num, img_bytes in enumerate(image_bytes_list, start=1):
-        if not img_bytes:
-            continue
-        try:
-            img = Image.open(io.BytesIO(img_bytes))
-            fmt = img.format or "JPEG"
-            ext = fmt.lower().replace("jpeg", "jpg")
-            out = os.path.join(output_dir, f"{str(page_num).zfill(4)}.{ext}")
-            with open(out, "wb") as f:
-                f.write(img_bytes)
+    async for idx, img_bytes in pages:
+        if img_bytes and await asyncio.to_thread(
+            _write_page_file, output_dir, idx + 1, img_bytes
+        ):
             saved += 1
-        except Exception as e:
-            print(f"    ⚠️  Skipped broken image on save: {e}")
 
     return saved
+
+
+# ---------------------------------------------------------------------------
+# PDF + CBZ
+# ---------------------------------------------------------------------------
+
+def images_to_pdf_and_cbz(
+    image_bytes_list: list,
+    pdf_path: str,
+    cbz_path: str,
+    manga_info: dict,
+    chapter_number: int,
+    total_chapters: int,
+    comic_info_template: str | None = None,
+) -> None:
+    """
+    Build the PDF and the CBZ for one chapter in a single call.
+    Meant for worker processes: the page bytes are pickled across once
+    instead of once per format.
+    """
+    images_to_pdf(image_bytes_list, pdf_path)
+    images_to_cbz(
+        image_bytes_list, cbz_path,
+        manga_info, chapter_number, total_chapters, comic_info_template,
+    )
@@ -3,11 +3,15 @@ colab_downloader.py — Fully parallel async chapter + image downloader
 
 Architecture
 ------------
-  asyncio.gather fires ALL selected chapters at once.
-  A semaphore (MAX_CHAPTER_WORKERS) caps how many chapters are ACTIVE simultaneously.
+  An asyncio.TaskGroup fires ALL selected chapters at once; if one chapter
+  crashes, its siblings are cancelled cleanly instead of being left running.
+  A chapter that merely fails to fetch, convert or save is logged and skipped.
+  A condition-guarded counter (MAX_CHAPTER_WORKERS) caps how many chapters are
+  ACTIVE simultaneously; the cap drops when the server answers 429 and climbs
+  back once pages download cleanly again.
   Inside each active chapter another semaphore (MAX_IMAGE_WORKERS) caps page fetches.
   This means chapters don't wait in a queue — they all start, then race through
-  the semaphore as slots free up, so you get maximum throughput without hammering
+  the limiter as slots free up, so you get maximum throughput without hammering
   the server.
 
   Chapter A: [img1 img2 img3 ... img10]  ← 10 in-flight at once
@@ -16,20 +20,40 @@ Architecture
   Chapter D: waiting for a slot...
   Chapter E: waiting for a slot...
 
-  httpx with HTTP/2 multiplexing means multiple requests share one TCP
-  connection → low overhead, fast throughput.
+  One httpx client with HTTP/2 multiplexing is shared by every chapter, so
+  all requests reuse the same pooled connections → low overhead, fast throughput.
+  If aiohttp is installed, page bytes go through one shared aiohttp session
+  instead (C-accelerated HTTP/1.1 parser, aiodns resolver when available);
+  httpx keeps the small HTML requests where HTTP/2 multiplexing helps most.
+  Both live in colab_scraper and survive between download_chapters() calls.
 """
 
 import asyncio
+import atexit
+import os
 import re
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from pathlib import Path
 
 import httpx
 from tqdm.notebook import tqdm
 
-from colab_scraper import BASE_URL, async_get_chapter_images
-from colab_converter import images_to_pdf, images_to_cbz, images_to_folder
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from colab_scraper import (
+    BASE_URL, async_get_chapter_images, get_client, get_page_session, run_sync,
+)
+from colab_converter import (
+    build_comic_info_template,
+    images_to_pdf, images_to_pdf_and_cbz, images_to_folder,
+    stream_images_to_cbz, stream_images_to_folder,
+)
 
 # ── Tunable concurrency knobs ────────────────────────────────────────────────
 MAX_CHAPTER_WORKERS  = 3     # chapters active simultaneously
@@ -38,8 +62,14 @@ MAX_IMAGE_WORKERS    = 10    # pages in-flight per chapter
 IMAGE_RETRIES        = 4     # max attempts per image
 IMAGE_BACKOFF        = [0.5, 1.0, 2.0, 4.0]   # wait between retries (seconds)
 CHAPTER_RETRIES      = 3     # max attempts to fetch a chapter's image list
+# ── Adaptive throttling ──────────────────────────────────────────────────────
+THROTTLE_AFTER_429   = 3     # 429 responses before dropping one active chapter
+RECOVER_AFTER_OK     = 50    # clean pages in a row before adding one back
 # ── HTTP ─────────────────────────────────────────────────────────────────────
 REQUEST_TIMEOUT      = 30    # seconds per request
+# ── Output ───────────────────────────────────────────────────────────────────
+LOG_FLUSH_INTERVAL   = 0.2   # seconds between batched stdout writes
+H2_STREAM_WINDOW     = 8 * 1024 * 1024   # HTTP/2 per-stream receive window (bytes)
 # ─────────────────────────────────────────────────────────────────────────────
 
 HEADERS = {
@@ -50,14 +80,121 @@ HEADERS = {
 # Valid output formats
 VALID_FORMATS = ("pdf", "cbz", "images", "all")
 
+# PDF/CBZ conversion is CPU-bound — run it in its own worker processes so
+# several chapters convert in parallel instead of serialising on the GIL,
+# and never queue behind blocking calls in the loop's default thread pool.
+# One core is left for the event loop. Created by _convert_pool() on first
+# use, never at import, so importing this module forks nothing.
+_CONVERT_POOL = None
+
+
+def _convert_pool() -> ProcessPoolExecutor:
+    global _CONVERT_POOL
+    if _CONVERT_POOL is None:
+        _CONVERT_POOL = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+    return _CONVERT_POOL
+
+
+@atexit.register
+def _shutdown_convert_pool() -> None:
+    global _CONVERT_POOL
+    if _CONVERT_POOL is not None:
+        _CONVERT_POOL.shutdown(wait=True, cancel_futures=True)
+        _CONVERT_POOL = None
+
+
+# ---------------------------------------------------------------------------
+# Batched progress output
+# ---------------------------------------------------------------------------
+
+class _BatchedLog:
+    """
+    Collects progress lines and writes them to stdout in one batch every
+    LOG_FLUSH_INTERVAL seconds while a run is active.
+    In Colab every print() is a round-trip over the kernel's output channel;
+    batching keeps chapter tasks from stalling the event loop on stdout.
+    """
+
+    def __init__(self):
+        self._lines = []
+        self._task  = None
+
+    def __call__(self, line: str = "") -> None:
+        self._lines.append(line)
+
+    def flush(self) -> None:
+        if self._lines:
+            batch, self._lines = self._lines, []
+            sys.stdout.write("\n".join(batch) + "\n")
+            sys.stdout.flush()
+
+    async def _flush_forever(self) -> None:
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            self.flush()
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._flush_forever())
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+        self._task = None
+        self.flush()
+
+
+_log = _BatchedLog()
+
+
+# ---------------------------------------------------------------------------
+# HTTP/2 flow-control window
+# ---------------------------------------------------------------------------
+
+def _enlarge_h2_stream_window() -> None:
+    """
+    Advertise a larger per-stream HTTP/2 receive window.
+
+    httpcore leaves SETTINGS_INITIAL_WINDOW_SIZE at the 64 KB default, so a
+    1–2 MB page stalls on a WINDOW_UPDATE round-trip every 64 KB. httpx has
+    no option for it, so wrap httpcore's connection preamble to send one
+    extra SETTINGS frame. Silently skipped if httpcore's internals change.
+    Only worth it when pages travel over httpx, i.e. without aiohttp.
+    """
+    try:
+        import h2.settings
+        from httpcore import AsyncHTTP2Connection
+        original = AsyncHTTP2Connection._send_connection_init
+    except (ImportError, AttributeError):
+        return
+
+    if getattr(original, "_weebcentral_patched", False):
+        return
+
+    async def _send_connection_init(self, request):
+        await original(self, request)
+        self._h2_state.update_settings(
+            {h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: H2_STREAM_WINDOW}
+        )
+        await self._write_outgoing_data(request)
+
+    _send_connection_init._weebcentral_patched = True
+    AsyncHTTP2Connection._send_connection_init = _send_connection_init
+
+
+if aiohttp is None:
+    _enlarge_h2_stream_window()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '\\/:*?"<>|'})
+
+
 def sanitize(name: str) -> str:
     """Strip characters that are illegal in filenames."""
-    return re.sub(r'[\\/:*?"<>|]', "_", name).strip()
+    return name.translate(_SANITIZE_TABLE).strip()
 
 
 def _fmt_duration(seconds: float) -> str:
@@ -113,31 +250,104 @@ def parse_chapter_selection(user_input: str, total: int) -> list:
         )
 
 
+# ---------------------------------------------------------------------------
+# Resizable chapter limiter
+# ---------------------------------------------------------------------------
+
+class _ChapterLimiter:
+    """
+    Caps active chapters at `limit` using an asyncio.Condition.
+    Unlike asyncio.Semaphore the limit can be changed while tasks are waiting,
+    which lets page fetches throttle chapter concurrency on 429 responses.
+    """
+
+    def __init__(self, limit: int):
+        self.limit     = limit
+        self.max_limit = limit
+        self.active    = 0
+        self._cond     = asyncio.Condition()
+        self._hits_429 = 0
+        self._ok_run   = 0
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self.limit = max(1, min(limit, self.max_limit))
+            self._cond.notify_all()
+
+    async def report(self, status_code: int) -> None:
+        """Feed one page response into the throttle rule."""
+        if status_code == 429:
+            self._ok_run    = 0
+            self._hits_429 += 1
+            if self._hits_429 >= THROTTLE_AFTER_429 and self.limit > 1:
+                self._hits_429 = 0
+                await self.set_limit(self.limit - 1)
+                _log(f"       🐢 Rate limited — {self.limit} chapter(s) active")
+        elif status_code == 200:
+            self._ok_run += 1
+            if self._ok_run >= RECOVER_AFTER_OK and self.limit < self.max_limit:
+                self._ok_run   = 0
+                self._hits_429 = 0
+                await self.set_limit(self.limit + 1)
+
+
+# ---------------------------------------------------------------------------
+# Page-download client
+# ---------------------------------------------------------------------------
+
+_FETCH_ERRORS = (httpx.TimeoutException, httpx.RequestError)
+_PAGE_TIMEOUT = None
+if aiohttp is not None:
+    _FETCH_ERRORS += (aiohttp.ClientError, asyncio.TimeoutError)
+    _PAGE_TIMEOUT  = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+
+async def _get_page(client, url: str) -> tuple:
+    """GET one page with either client type. Returns (status, bytes | None)."""
+    if aiohttp is not None and isinstance(client, aiohttp.ClientSession):
+        async with client.get(url, timeout=_PAGE_TIMEOUT) as r:
+            return r.status, (await r.read() if r.status == 200 else None)
+
+    r = await client.get(url, timeout=REQUEST_TIMEOUT)
+    return r.status_code, (r.content if r.status_code == 200 else None)
+
+
 # ---------------------------------------------------------------------------
 # Async image fetcher with retry
 # ---------------------------------------------------------------------------
 
 async def _fetch_image(
-    client: httpx.AsyncClient,
+    client,
     url: str,
     semaphore: asyncio.Semaphore,
+    limiter: _ChapterLimiter | None = None,
 ) -> bytes | None:
     """
     Download one image.
     Bounded by semaphore; retries with exponential backoff on failure.
+    Response codes are reported to `limiter` for adaptive throttling.
     """
     async with semaphore:
         for attempt in range(IMAGE_RETRIES):
             try:
-                r = await client.get(url, timeout=REQUEST_TIMEOUT)
-                if r.status_code == 200:
-                    return r.content
-                # Treat 429 / 5xx as retriable
-                if r.status_code in (429, 500, 502, 503, 504):
-                    raise httpx.HTTPStatusError(
-                        f"HTTP {r.status_code}", request=r.request, response=r
-                    )
-            except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPStatusError):
+                status, body = await _get_page(client, url)
+                if limiter is not None:
+                    await limiter.report(status)
+                if status == 200:
+                    return body
+                # Any other status (429 / 5xx / …) falls through to a retry
+            except _FETCH_ERRORS:
                 pass
 
             if attempt < IMAGE_RETRIES - 1:
@@ -146,33 +356,53 @@ async def _fetch_image(
         return None   # all retries exhausted
 
 
-async def _download_pages(image_urls: list, desc: str = "") -> list:
+async def _stream_pages(
+    client,
+    image_urls: list,
+    pbar: tqdm | None = None,
+    limiter: _ChapterLimiter | None = None,
+):
     """
-    Download all pages for one chapter in parallel.
-    Uses asyncio.gather to preserve page order.
-    Returns list[bytes | None].
+    Download all pages for one chapter in parallel over the shared client.
+    Async generator yielding (page_index, bytes | None) in completion order,
+    so callers can consume each page as soon as it lands.
+    Ticks the run-wide `pbar` once per finished page.
+    Use it under contextlib.aclosing(): if the consumer stops early, closing
+    the generator cancels the fetches still in flight.
     """
     semaphore = asyncio.Semaphore(MAX_IMAGE_WORKERS)
 
-    async with httpx.AsyncClient(
-        headers=HEADERS,
-        http2=True,
-        limits=httpx.Limits(
-            max_connections=MAX_IMAGE_WORKERS + 5,
-            max_keepalive_connections=MAX_IMAGE_WORKERS,
-        ),
-    ) as client:
-        pbar = tqdm(total=len(image_urls), desc=desc, leave=False, unit="pg")
-
-        async def fetch_and_tick(url: str) -> bytes | None:
-            result = await _fetch_image(client, url, semaphore)
+    async def fetch_and_tick(idx: int, url: str) -> tuple:
+        result = await _fetch_image(client, url, semaphore, limiter)
+        if pbar is not None:
             pbar.update(1)
-            return result
+        return idx, result
 
-        results = await asyncio.gather(*[fetch_and_tick(u) for u in image_urls])
-        pbar.close()
-
-    return list(results)
+    tasks = [asyncio.create_task(fetch_and_tick(i, u)) for i, u in enumerate(image_urls)]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _download_pages(
+    client,
+    image_urls: list,
+    pbar: tqdm | None = None,
+    limiter: _ChapterLimiter | None = None,
+) -> list:
+    """
+    Download all pages for one chapter and return them in page order.
+    Returns list[bytes | None].
+    """
+    results = [None] * len(image_urls)
+    async with aclosing(_stream_pages(client, image_urls, pbar, limiter)) as pages:
+        async for idx, img_bytes in pages:
+            results[idx] = img_bytes
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -186,76 +416,120 @@ async def _process_chapter(
     manga_info: dict,
     output_format: str,
     series_dir: Path,
-    chapter_semaphore: asyncio.Semaphore,
+    chapter_limiter: _ChapterLimiter,
     position: int,
     total_selected: int,
     shared_client: httpx.AsyncClient,
+    page_client,
+    comic_info_template: str | None = None,
+    pbar: tqdm | None = None,
 ) -> None:
     """
     Full pipeline for one chapter:
       1. Fetch image URL list (async, with retry — via shared_client)
-      2. Download all pages in parallel
-      3. Convert & save (runs in thread pool to keep event loop free)
+      2. Download all pages in parallel (via page_client)
+      3. Convert & save (runs in process pool to keep event loop free)
+    CBZ-only and images-only output skip the in-memory page list and write
+    each page out as it arrives, overlapping downloads with disk writes.
     """
-    async with chapter_semaphore:
+    async with chapter_limiter:
         title_safe    = sanitize(manga_info["title"])
         ch_title_safe = sanitize(chapter["title"])[:80]
         file_stem     = f"{title_safe} - Ch{str(ch_num).zfill(3)} - {ch_title_safe}"
-        bar_label     = f"  Ch{str(ch_num).zfill(3)}"
         tag           = f"[{position}/{total_selected}]"
 
-        print(f"{tag} 📖  {chapter['title']}  ({chapter['date']})")
+        _log(f"{tag} 📖  {chapter['title']}  ({chapter['date']})")
 
         # ── 1. Fetch image URL list (async, retried inside async_get_chapter_images) ──
         try:
             image_urls = await async_get_chapter_images(chapter["url"], shared_client)
         except Exception as e:
-            print(f"{tag} ❌  Could not get image list after {CHAPTER_RETRIES} retries: {e}")
+            _log(f"{tag} ❌  Could not get image list after {CHAPTER_RETRIES} retries: {e}")
             return
 
         if not image_urls:
-            print(f"{tag} ⚠️   No images found for this chapter, skipping.")
+            _log(f"{tag} ⚠️   No images found for this chapter, skipping.")
             return
 
-        print(f"       🖼  {len(image_urls)} pages — downloading in parallel...")
+        _log(f"       🖼  {len(image_urls)} pages — downloading in parallel...")
+        if pbar is not None:
+            pbar.total += len(image_urls)
+            pbar.refresh()
+
+        # ── 2+3. Single streamable output → write pages as they arrive ──────────────
+        if output_format in ("cbz", "images"):
+            stream = _stream_pages(page_client, image_urls, pbar, chapter_limiter)
+            try:
+                async with aclosing(stream) as pages:
+                    if output_format == "cbz":
+                        out_path = series_dir / f"{file_stem}.cbz"
+                        good = await stream_images_to_cbz(
+                            pages, str(out_path),
+                            manga_info, ch_num, total_chapters, comic_info_template,
+                        )
+                        label = f"📦 Built CBZ → {out_path.name}"
+                    else:
+                        out_path = series_dir / file_stem
+                        good = await stream_images_to_folder(pages, str(out_path))
+                        label = f"🗂  Saved raw images → {out_path.name}/  ({good} files)"
+            except Exception as e:
+                # A disk/encode failure loses this chapter only, not its siblings
+                _log(f"{tag} ❌  Could not save chapter: {e}")
+                _log()
+                return
+
+            failed = len(image_urls) - good
+            status = f"✅ {good}/{len(image_urls)} pages"
+            if failed:
+                status += f"  ⚠️  {failed} failed"
+            _log(f"       {status}")
+            _log(f"       {label}")
+            _log()
+            return
 
         # ── 2. Download pages ────────────────────────────────────────────────────────
-        image_bytes_list = await _download_pages(image_urls, desc=bar_label)
+        image_bytes_list = await _download_pages(
+            page_client, image_urls, pbar, chapter_limiter,
+        )
 
         good   = sum(1 for x in image_bytes_list if x)
         failed = len(image_urls) - good
         status = f"✅ {good}/{len(image_urls)} pages"
         if failed:
             status += f"  ⚠️  {failed} failed"
-        print(f"       {status}")
+        _log(f"       {status}")
 
-        # ── 3. Convert & save (CPU-bound → thread pool) ──────────────────────────────
-        loop = asyncio.get_event_loop()
+        # ── 3. Convert & save (CPU-bound → process pool) ─────────────────────────────
+        loop     = asyncio.get_running_loop()
+        pdf_path = str(series_dir / f"{file_stem}.pdf")
 
-        if output_format in ("pdf", "all"):
-            pdf_path = str(series_dir / f"{file_stem}.pdf")
-            print(f"       📄 Building PDF...")
-            await loop.run_in_executor(None, images_to_pdf, image_bytes_list, pdf_path)
-            print(f"          → {Path(pdf_path).name}")
-
-        if output_format in ("cbz", "all"):
-            cbz_path = str(series_dir / f"{file_stem}.cbz")
-            print(f"       📦 Building CBZ...")
-            await loop.run_in_executor(
-                None, images_to_cbz,
-                image_bytes_list, cbz_path, manga_info, ch_num, total_chapters,
-            )
-            print(f"          → {Path(cbz_path).name}")
-
-        if output_format in ("images", "all"):
-            img_dir = str(series_dir / file_stem)
-            print(f"       🗂  Saving raw images...")
-            saved = await loop.run_in_executor(
-                None, images_to_folder, image_bytes_list, img_dir
-            )
-            print(f"          → {Path(img_dir).name}/  ({saved} files)")
+        try:
+            if output_format == "pdf":
+                _log(f"       📄 Building PDF...")
+                await loop.run_in_executor(_convert_pool(), images_to_pdf, image_bytes_list, pdf_path)
+                _log(f"          → {Path(pdf_path).name}")
+            else:
+                # "all": one submit for both formats, so the pages are pickled once
+                cbz_path = str(series_dir / f"{file_stem}.cbz")
+                _log(f"       📄 Building PDF + 📦 CBZ...")
+                await loop.run_in_executor(
+                    _convert_pool(), images_to_pdf_and_cbz,
+                    image_bytes_list, pdf_path, cbz_path, manga_info, ch_num, total_chapters,
+                    comic_info_template,
+                )
+                _log(f"          → {Path(pdf_path).name}")
+                _log(f"          → {Path(cbz_path).name}")
+
+                # Plain file writes are I/O-bound — a thread, not a worker process
+                img_dir = str(series_dir / file_stem)
+                _log(f"       🗂  Saving raw images...")
+                saved = await asyncio.to_thread(images_to_folder, image_bytes_list, img_dir)
+                _log(f"          → {Path(img_dir).name}/  ({saved} files)")
+        except Exception as e:
+            # A conversion/disk failure loses this chapter only, not its siblings
+            _log(f"{tag} ❌  Could not save chapter: {e}")
 
-        print()
+        _log()
 
 
 # ---------------------------------------------------------------------------
@@ -270,46 +544,58 @@ async def _run_all_chapters(
     series_dir: Path,
 ) -> None:
     """
-    Fire all chapter tasks at once. The semaphore enforces MAX_CHAPTER_WORKERS.
-    A single shared httpx.AsyncClient is reused across all chapter image-list
-    fetches for connection pooling efficiency.
+    Fire all chapter tasks at once. The limiter enforces MAX_CHAPTER_WORKERS.
+    A single shared httpx.AsyncClient is reused for every image-list fetch,
+    and a single page client (the shared aiohttp session, or that same httpx
+    client) for every page download, so TLS + connection setup happens once
+    per session rather than once per chapter.
     """
     total_chapters = len(chapters)
-    chapter_sem    = asyncio.Semaphore(MAX_CHAPTER_WORKERS)
-
-    # Shared client for image-list fetching (not for page downloads — those
-    # each create their own client to isolate connection pools per chapter)
-    async with httpx.AsyncClient(
-        headers=HEADERS,
-        http2=True,
-        limits=httpx.Limits(
-            max_connections=MAX_CHAPTER_WORKERS * 2,
-            max_keepalive_connections=MAX_CHAPTER_WORKERS,
-        ),
-    ) as shared_client:
-
-        tasks = []
-        for pos, idx in enumerate(selected_indices, 1):
-            if idx < 0 or idx >= total_chapters:
-                print(f"⚠️  Chapter {idx + 1} out of range (total: {total_chapters}), skipping.")
-                continue
-            tasks.append(
-                _process_chapter(
-                    chapter           = chapters[idx],
-                    ch_num            = idx + 1,
-                    total_chapters    = total_chapters,
-                    manga_info        = manga_info,
-                    output_format     = output_format,
-                    series_dir        = series_dir,
-                    chapter_semaphore = chapter_sem,
-                    position          = pos,
-                    total_selected    = len(selected_indices),
-                    shared_client     = shared_client,
-                )
-            )
+    chapter_lim    = _ChapterLimiter(MAX_CHAPTER_WORKERS)
+
+    # ComicInfo.xml is identical across chapters apart from Number/Count
+    comic_info_template = (
+        build_comic_info_template(manga_info)
+        if output_format in ("cbz", "all") else None
+    )
 
-        # All tasks fire immediately; semaphore gates actual work
-        await asyncio.gather(*tasks)
+    # One progress bar for the whole run; each chapter adds its page count
+    # once its image list is known. Far fewer notebook widget refreshes than
+    # a bar per chapter.
+    pbar = tqdm(total=0, desc="Pages", unit="pg")
+
+    # One client for image lists (and page downloads, unless aiohttp is present),
+    # kept alive across download_chapters() calls
+    shared_client = await get_client()
+    page_client   = await get_page_session() or shared_client
+    async with _log:
+
+        # All tasks fire immediately; limiter gates actual work
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for pos, idx in enumerate(selected_indices, 1):
+                    if idx < 0 or idx >= total_chapters:
+                        _log(f"⚠️  Chapter {idx + 1} out of range (total: {total_chapters}), skipping.")
+                        continue
+                    tg.create_task(
+                        _process_chapter(
+                            chapter             = chapters[idx],
+                            ch_num              = idx + 1,
+                            total_chapters      = total_chapters,
+                            manga_info          = manga_info,
+                            output_format       = output_format,
+                            series_dir          = series_dir,
+                            chapter_limiter     = chapter_lim,
+                            position            = pos,
+                            total_selected      = len(selected_indices),
+                            shared_client       = shared_client,
+                            page_client         = page_client,
+                            comic_info_template = comic_info_template,
+                            pbar                = pbar,
+                        )
+                    )
+        finally:
+            pbar.close()
 
 
 # ---------------------------------------------------------------------------
@@ -362,14 +648,7 @@ def download_chapters(
 
     t0 = time.perf_counter()
 
-    # nest_asyncio lets asyncio.run() work inside Jupyter/Colab's running event loop
-    try:
-        import nest_asyncio
-        nest_asyncio.apply()
-    except ImportError:
-        pass
-
-    asyncio.run(
+    run_sync(
         _run_all_chapters(
             manga_info       = manga_info,
             chapters         = chapters,
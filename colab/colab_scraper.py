@@ -2,11 +2,18 @@
 colab_scraper.py — WeebCentral series metadata & chapter list scraping
 """
 
+import asyncio
+import atexit
 import re
 
 import httpx
-import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 BASE_URL = "https://weebcentral.com"
 
@@ -25,17 +32,170 @@ IMG_HEADERS = {
 SCRAPE_RETRIES = 4
 SCRAPE_BACKOFF = [1, 2, 4, 8]   # seconds between retry attempts
 
+# Compiled once — reused for every chapter's image-list page
+_IMG_SRC_XPATH = etree.XPath("//img/@src")
+
 
 # ---------------------------------------------------------------------------
-# Series info  (sync — only called once, no need for async)
+# Sync helpers
 # ---------------------------------------------------------------------------
 
-def scrape_manga_info(url: str) -> dict:
-    """Scrape series metadata from a WeebCentral series page."""
-    print(f"🔎 Fetching series page: {url}")
-    res = requests.get(url, headers=HEADERS, timeout=30)
-    res.raise_for_status()
-    soup = BeautifulSoup(res.text, "lxml")
+def run_sync(coro):
+    """Run a coroutine to completion, also inside Jupyter/Colab's running loop."""
+    # nest_asyncio lets asyncio.run() work inside Jupyter/Colab's running event loop
+    try:
+        import nest_asyncio
+        nest_asyncio.apply()
+    except ImportError:
+        pass
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP client  (lives across scrape / download_chapters calls)
+# ---------------------------------------------------------------------------
+
+_GLOBAL_CLIENT: httpx.AsyncClient | None = None
+_GLOBAL_CLIENT_LOOP = None
+_GLOBAL_CLIENT_CLOSER: asyncio.Task | None = None
+_GLOBAL_PAGE_SESSION = None    # aiohttp.ClientSession, lives and dies with _GLOBAL_CLIENT
+
+
+async def _close_when_loop_ends(client: httpx.AsyncClient) -> None:
+    """
+    Park until cancelled, then close `client` on the loop that owns it.
+    asyncio.run() cancels leftover tasks and waits for them before closing
+    its loop, so the client's connections are shut down while they still can be.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        if not client.is_closed:
+            await client.aclose()
+        if _GLOBAL_CLIENT is client:
+            await _discard_page_session()
+
+
+async def _discard_client(client: httpx.AsyncClient) -> None:
+    """Close a client left over from another event loop."""
+    if client.is_closed:
+        return
+    try:
+        await client.aclose()
+    except RuntimeError:
+        # Its loop is already closed, so the connections can't be shut down
+        # cleanly; aclose() still marked them closed, and dropping the client
+        # lets their transports release the sockets
+        pass
+
+
+async def _discard_page_session() -> None:
+    """Close the shared aiohttp session, if any (same caveats as _discard_client)."""
+    global _GLOBAL_PAGE_SESSION
+    session, _GLOBAL_PAGE_SESSION = _GLOBAL_PAGE_SESSION, None
+    if session is None or session.closed:
+        return
+    try:
+        await session.close()
+    except RuntimeError:
+        pass
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Return the module-wide httpx client, creating it on first use.
+
+    Keeping one client alive between calls preserves its open HTTP/2
+    connections, TLS sessions and DNS lookups, so a second series in the
+    same Colab session skips the handshakes. The client is rebuilt if it
+    was closed or belongs to a different event loop (plain asyncio.run()
+    outside Jupyter creates a fresh loop per call); a client is closed on
+    its own loop when that loop shuts down.
+    """
+    global _GLOBAL_CLIENT, _GLOBAL_CLIENT_LOOP, _GLOBAL_CLIENT_CLOSER
+    loop = asyncio.get_running_loop()
+    if (
+        _GLOBAL_CLIENT is None
+        or _GLOBAL_CLIENT.is_closed
+        or _GLOBAL_CLIENT_LOOP is not loop
+    ):
+        if _GLOBAL_CLIENT is not None:
+            await _discard_client(_GLOBAL_CLIENT)
+        await _discard_page_session()
+        _GLOBAL_CLIENT = httpx.AsyncClient(
+            headers=HEADERS,
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        _GLOBAL_CLIENT_LOOP = loop
+        _GLOBAL_CLIENT_CLOSER = loop.create_task(_close_when_loop_ends(_GLOBAL_CLIENT))
+    return _GLOBAL_CLIENT
+
+
+async def get_page_session():
+    """
+    Return the module-wide aiohttp session for image bytes, or None when
+    aiohttp isn't installed (use get_client() instead).
+
+    aiohttp's C-accelerated HTTP/1.1 parser beats httpx on large bodies.
+    The session shares the httpx client's lifetime — created on the same
+    loop, rebuilt whenever the client is, and closed alongside it — so its
+    pooled connections, TLS sessions and cached DNS lookups (via aiodns
+    when available) carry over between download runs too.
+    """
+    global _GLOBAL_PAGE_SESSION
+    if aiohttp is None:
+        return None
+
+    await get_client()   # drops a session left over from another event loop
+    if _GLOBAL_PAGE_SESSION is None or _GLOBAL_PAGE_SESSION.closed:
+        try:
+            resolver = aiohttp.AsyncResolver()     # needs aiodns
+        except RuntimeError:
+            resolver = None
+        _GLOBAL_PAGE_SESSION = aiohttp.ClientSession(
+            headers=HEADERS,
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, resolver=resolver),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _GLOBAL_PAGE_SESSION
+
+
+async def aclose_client() -> None:
+    """
+    Close the shared client and page session (both are recreated on the
+    next get_client() / get_page_session()).
+    """
+    global _GLOBAL_CLIENT, _GLOBAL_CLIENT_LOOP, _GLOBAL_CLIENT_CLOSER
+    if _GLOBAL_CLIENT_CLOSER is not None and _GLOBAL_CLIENT_LOOP is asyncio.get_running_loop():
+        _GLOBAL_CLIENT_CLOSER.cancel()
+    if _GLOBAL_CLIENT is not None:
+        await _discard_client(_GLOBAL_CLIENT)
+    await _discard_page_session()
+    _GLOBAL_CLIENT        = None
+    _GLOBAL_CLIENT_LOOP   = None
+    _GLOBAL_CLIENT_CLOSER = None
+
+
+@atexit.register
+def _close_client_at_exit() -> None:
+    client_open  = _GLOBAL_CLIENT is not None and not _GLOBAL_CLIENT.is_closed
+    session_open = _GLOBAL_PAGE_SESSION is not None and not _GLOBAL_PAGE_SESSION.closed
+    if not (client_open or session_open):
+        return
+    try:
+        run_sync(aclose_client())
+    except Exception:
+        pass   # loop already gone at interpreter shutdown — nothing left to flush
+
+
+# ---------------------------------------------------------------------------
+# Series info
+# ---------------------------------------------------------------------------
+
+def _parse_manga_info(page_html: str, url: str) -> dict:
+    soup = BeautifulSoup(page_html, "lxml")
 
     title_tag = soup.find("h1")
     title = title_tag.text.strip() if title_tag else "Unknown Title"
@@ -58,28 +218,28 @@ def scrape_manga_info(url: str) -> dict:
     status_tag = soup.select_one("a[href*='included_status=']")
     status     = status_tag.text.strip() if status_tag else "Unknown"
 
-    released = None
+    # One sweep over <li> nodes, dispatching on the <strong> label
+    released    = None
+    description = None
+    associated  = []
     for li in soup.find_all("li"):
         if "Released:" in li.text:
             span = li.find("span")
             if span:
                 released = span.text.strip()
 
-    description = None
-    for li in soup.find_all("li"):
         strong = li.find("strong")
-        if strong and "Description" in strong.text:
+        if not strong:
+            continue
+        label = strong.text
+        if "Description" in label:
             p = li.find("p")
             if p:
                 description = p.text.strip()
-
-    associated = []
-    for li in soup.find_all("li"):
-        strong = li.find("strong")
-        if strong and "Associated Name" in strong.text:
+        elif "Associated Name" in label:
             associated = [x.text.strip() for x in li.select("li")]
 
-    info = {
+    return {
         "title":            title,
         "cover_url":        cover_url,
         "authors":          authors,
@@ -92,43 +252,49 @@ def scrape_manga_info(url: str) -> dict:
         "series_url":       url,
     }
 
+
+def _print_manga_info(info: dict) -> None:
+    tags        = info["tags"]
+    description = info["description"]
+
     print(f"\n{'='*55}")
-    print(f"📖 Title    : {title}")
-    print(f"👤 Authors  : {', '.join(authors) if authors else 'N/A'}")
+    print(f"📖 Title    : {info['title']}")
+    print(f"👤 Authors  : {', '.join(info['authors']) if info['authors'] else 'N/A'}")
     print(f"🏷  Tags     : {', '.join(tags[:5]) if tags else 'N/A'}{' ...' if len(tags) > 5 else ''}")
-    print(f"📌 Type     : {manga_type}")
-    print(f"📊 Status   : {status}")
-    print(f"📅 Released : {released or 'N/A'}")
-    print(f"🖼  Cover    : {cover_url or 'N/A'}")
+    print(f"📌 Type     : {info['type']}")
+    print(f"📊 Status   : {info['status']}")
+    print(f"📅 Released : {info['released'] or 'N/A'}")
+    print(f"🖼  Cover    : {info['cover_url'] or 'N/A'}")
     print(f"{'='*55}")
     if description:
         preview = description[:300] + ("..." if len(description) > 300 else "")
         print(f"\n📝 Description:\n{preview}\n")
 
-    return info
 
+async def async_scrape_manga_info(url: str, client: httpx.AsyncClient) -> dict:
+    """Scrape series metadata from a WeebCentral series page."""
+    print(f"🔎 Fetching series page: {url}")
+    res = await client.get(url, timeout=30)
+    res.raise_for_status()
 
-# ---------------------------------------------------------------------------
-# Chapter list  (sync — only called once)
-# ---------------------------------------------------------------------------
+    info = _parse_manga_info(res.text, url)
+    _print_manga_info(info)
+    return info
 
-def scrape_chapter_list(series_url: str) -> list:
-    """
-    Fetch the full chapter list for a series.
-    Returns chapters in ascending order: index 1 = oldest/first chapter.
-    """
-    match = re.search(r"/series/([^/]+)/", series_url)
-    if not match:
-        raise ValueError(f"Could not extract series ID from URL: {series_url}")
-    series_id = match.group(1)
 
-    full_ch_url = f"{BASE_URL}/series/{series_id}/full-chapter-list"
-    print(f"🔎 Fetching chapter list: {full_ch_url}")
+def scrape_manga_info(url: str) -> dict:
+    """Sync wrapper around async_scrape_manga_info()."""
+    async def _run():
+        return await async_scrape_manga_info(url, await get_client())
+    return run_sync(_run())
 
-    res = requests.get(full_ch_url, headers=HEADERS, timeout=30)
-    res.raise_for_status()
 
-    soup = BeautifulSoup(res.text, "lxml")
+# ---------------------------------------------------------------------------
+# Chapter list
+# ---------------------------------------------------------------------------
+
+def _parse_chapter_list(page_html: str) -> list:
+    soup = BeautifulSoup(page_html, "lxml")
     chapter_links = soup.select("a[href*='/chapters/']")
 
     # WeebCentral returns newest-first → reverse so index 1 = Chapter 1 (oldest)
@@ -146,6 +312,26 @@ def scrape_chapter_list(series_url: str) -> list:
             "url":   chapter_url,
             "date":  date_tag.text.strip() if date_tag else "Unknown",
         })
+    return chapters
+
+
+async def async_scrape_chapter_list(series_url: str, client: httpx.AsyncClient) -> list:
+    """
+    Fetch the full chapter list for a series.
+    Returns chapters in ascending order: index 1 = oldest/first chapter.
+    """
+    match = re.search(r"/series/([^/]+)/", series_url)
+    if not match:
+        raise ValueError(f"Could not extract series ID from URL: {series_url}")
+    series_id = match.group(1)
+
+    full_ch_url = f"{BASE_URL}/series/{series_id}/full-chapter-list"
+    print(f"🔎 Fetching chapter list: {full_ch_url}")
+
+    res = await client.get(full_ch_url, timeout=30)
+    res.raise_for_status()
+
+    chapters = _parse_chapter_list(res.text)
 
     print(f"\n📚 Total chapters: {len(chapters)}")
     if chapters:
@@ -155,10 +341,45 @@ def scrape_chapter_list(series_url: str) -> list:
     return chapters
 
 
+def scrape_chapter_list(series_url: str) -> list:
+    """Sync wrapper around async_scrape_chapter_list()."""
+    async def _run():
+        return await async_scrape_chapter_list(series_url, await get_client())
+    return run_sync(_run())
+
+
+# ---------------------------------------------------------------------------
+# Series info + chapter list together
+# ---------------------------------------------------------------------------
+
+def scrape_series(url: str) -> tuple:
+    """
+    Fetch series metadata and the chapter list concurrently over one
+    HTTP/2 connection. Returns (manga_info, chapters).
+    """
+    async def _run():
+        client = await get_client()
+        return await asyncio.gather(
+            async_scrape_manga_info(url, client),
+            async_scrape_chapter_list(url, client),
+        )
+    manga_info, chapters = run_sync(_run())
+    return manga_info, chapters
+
+
 # ---------------------------------------------------------------------------
 # Chapter image list  (async — called in parallel for many chapters at once)
 # ---------------------------------------------------------------------------
 
+def _parse_image_list(content: bytes) -> list:
+    """Extract page image URLs from an image-list page (lxml, no soup tree)."""
+    tree = lxml_html.fromstring(content)
+    return [
+        str(src) for src in _IMG_SRC_XPATH(tree)
+        if src and "/static/" not in src and "broken_image" not in src
+    ]
+
+
 async def async_get_chapter_images(
     chapter_url: str,
     client: httpx.AsyncClient,
@@ -175,20 +396,12 @@ async def async_get_chapter_images(
         try:
             r = await client.get(images_url, timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.text, "lxml")
-            images = []
-            for img in soup.find_all("img"):
-                src = img.get("src")
-                if not src:
-                    continue
-                if "/static/" in src or "broken_image" in src:
-                    continue
-                images.append(src)
-            return images
+            # Parse off the event loop so page downloads keep flowing
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _parse_image_list, r.content)
         except Exception as exc:
             last_exc = exc
             if attempt < SCRAPE_RETRIES - 1:
-                import asyncio
                 wait = SCRAPE_BACKOFF[attempt]
                 await asyncio.sleep(wait)
 
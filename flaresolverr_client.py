@@ -1,12 +1,139 @@
 import requests
+from requests.adapters import HTTPAdapter
+import re
+import socket
 import time
 import logging
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+from typing import List, Optional
+from urllib.parse import urlparse
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+# orjson parses FlareSolverr's large JSON envelopes several times faster
+try:
+    import orjson
+    _loads = orjson.loads
+    _encode = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _encode(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# ijson lets get() stream the envelope and skip fields it never uses
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Request bodies are pre-encoded with _encode and posted as data=
+_JSON_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
 
 logger = logging.getLogger(__name__)
 
 FLARESOLVERR_URL = "http://localhost:8191/v1"
+_FLARESOLVERR_HEALTH_URL = FLARESOLVERR_URL.rsplit("/v1", 1)[0] + "/health"
 DEFAULT_TIMEOUT = 60000  # 60 seconds in milliseconds
+CACHE_TTL = 300          # seconds a solved page stays cached
+CACHE_MAX_ENTRIES = 64
+HTTP_POOL_MAXSIZE = 16   # keep-alive sockets per FlareSolverrSession
+HEALTH_CACHE_TTL = 5.0   # seconds a health result is reused as-is
+HEALTH_REVALIDATE = 30.0 # seconds between full HTTP /health checks while the port is open
+HEALTH_CONNECT_TIMEOUT = 0.3
+
+
+class _LoopbackAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets skip Nagle and keep idle connections alive."""
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self._SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _pooled_http_session() -> requests.Session:
+    """Keep-alive session for talking to the local FlareSolverr server."""
+    http = requests.Session()
+    adapter = _LoopbackAdapter(pool_connections=2, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    http.headers.update({"Connection": "keep-alive"})
+    return http
+
+
+# Shared by health checks so repeated probes reuse one socket
+_health_session = _pooled_http_session()
+
+# Static images are plain CDN downloads; get() tries them directly before FlareSolverr
+_DIRECT_BYPASS = re.compile(r"\.(?:jpe?g|png|webp|gif|avif)(?:\?|$)", re.I)
+_DIRECT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/avif,image/webp,image/apng,image/*,*/*;q=0.8',
+}
+_CF_CHALLENGE_MARKERS = (b"Just a moment...", b"challenge-platform", b"cf-chl")
+
+
+def _is_cf_challenge(resp: requests.Response) -> bool:
+    """True if a direct response is a Cloudflare challenge page."""
+    if resp.status_code not in (403, 503):
+        return False
+    head = resp.content[:2048]
+    return any(marker in head for marker in _CF_CHALLENGE_MARKERS)
+
+
+# Solution fields FakeSolverrResponse never reads (screenshots are base64 images)
+_SKIPPED_SOLUTION_FIELDS = {"screenshot"}
+
+
+def _read_envelope(resp: requests.Response) -> dict:
+    """
+    Decode a FlareSolverr reply. With ijson installed the streamed body is
+    parsed incrementally and only the top-level status/message and the
+    solution fields are built; otherwise the whole body is parsed at once.
+    """
+    if ijson is None:
+        return _loads(resp.content)
+
+    resp.raw.decode_content = True
+    data: dict = {}
+    solution: dict = {}
+    builder = None
+    key = None
+    try:
+        for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "solution." + key and event in ("end_map", "end_array"):
+                    solution[key] = builder.value
+                    builder = None
+            elif prefix == "solution" and event == "start_map":
+                data["solution"] = solution
+            elif prefix in ("status", "message"):
+                data[prefix] = value
+            elif prefix.startswith("solution.") and prefix.count(".") == 1 and event != "map_key":
+                key = prefix[len("solution."):]
+                if key in _SKIPPED_SOLUTION_FIELDS:
+                    continue
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    solution[key] = value
+    except ijson.JSONError as e:
+        raise ValueError(f"Malformed FlareSolverr response: {e}") from e
+    except ReadTimeoutError as e:
+        raise requests.exceptions.Timeout(e) from e
+    except ProtocolError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+    return data
+
 
 class FlareSolverrSession:
     """
@@ -19,6 +146,17 @@ class FlareSolverrSession:
         self.flaresolverr_url = flaresolverr_url
         self._session_id: Optional[str] = None
         self._last_used = 0
+        # One pooled HTTP session so every call reuses the same TCP socket
+        self._http = _pooled_http_session()
+        # Small LRU+TTL cache of solved pages: url -> (expiry, response)
+        self._cache: "OrderedDict[str, tuple[float, FakeSolverrResponse]]" = OrderedDict()
+        self._cache_ttl = CACHE_TTL
+        self._cache_lock = Lock()
+        # Worker threads for get_many(), created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_workers = 0
+        # Plain HTTP session for _DIRECT_BYPASS URLs, created on first use
+        self._direct: Optional[requests.Session] = None
 
     def _ensure_session(self):
         """Create a session if one doesn't exist."""
@@ -31,14 +169,14 @@ class FlareSolverrSession:
     def create_session(self) -> Optional[str]:
         """Create a new persistent session in FlareSolverr."""
         try:
-            resp = requests.post(
-                self.flaresolverr_url, 
+            resp = self._http.post(
+                self.flaresolverr_url,
                 json={"cmd": "sessions.create"},
                 timeout=30
             )
             resp.raise_for_status()
-            data = resp.json()
-            
+            data = _loads(resp.content)
+
             if data.get("status") == "ok":
                 self._session_id = data["session"]
                 self._last_used = time.time()
@@ -52,7 +190,7 @@ class FlareSolverrSession:
             logger.error(f"Could not connect to FlareSolverr at {self.flaresolverr_url}: {e}")
             logger.info("💡 Make sure FlareSolverr is running. Try: python start_flaresolverr.py")
             return None
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Request to FlareSolverr failed: {e}")
             return None
 
@@ -60,7 +198,7 @@ class FlareSolverrSession:
         """Destroy the current session."""
         if self._session_id:
             try:
-                resp = requests.post(
+                resp = self._http.post(
                     self.flaresolverr_url,
                     json={"cmd": "sessions.destroy", "session": self._session_id},
                     timeout=10
@@ -72,12 +210,80 @@ class FlareSolverrSession:
             finally:
                 self._session_id = None
                 self._last_used = 0
+                self._http.close()
+                if self._direct is not None:
+                    self._direct.close()
+                    self._direct = None
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                    self._pool = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _cache_lookup(self, url: str) -> Optional["FakeSolverrResponse"]:
+        with self._cache_lock:
+            entry = self._cache.get(url)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._cache[url]
+                return None
+            self._cache.move_to_end(url)
+            return entry[1]
+
+    def _cache_store(self, url: str, response: "FakeSolverrResponse") -> None:
+        with self._cache_lock:
+            self._cache[url] = (time.monotonic() + self._cache_ttl, response)
+            self._cache.move_to_end(url)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _post_command(self, payload: dict, timeout) -> dict:
+        """POST a pre-encoded command to FlareSolverr and decode the reply."""
+        with self._http.post(
+            self.flaresolverr_url, data=_encode(payload), headers=_JSON_HEADERS,
+            timeout=timeout, stream=ijson is not None
+        ) as resp:
+            resp.raise_for_status()
+            return _read_envelope(resp)
+
+    def _get_direct(self, url: str, timeout) -> Optional[requests.Response]:
+        """Fetch url without FlareSolverr; None if it failed or hit a challenge."""
+        if self._direct is None:
+            self._direct = _pooled_http_session()
+            self._direct.headers.update(_DIRECT_HEADERS)
+        try:
+            resp = self._direct.get(url, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Direct fetch of {url} failed, using FlareSolverr: {e}")
+            return None
+        if _is_cf_challenge(resp):
+            return None
+        return resp
 
     def get(self, url: str, **kwargs):
         """
         Execute a GET request via FlareSolverr.
         Returns a FakeSolverrResponse object compatible with requests.Response.
+        Successful responses are cached for CACHE_TTL seconds; pass
+        no_cache=True to bypass the cache.
+        Static image URLs are fetched directly first and come back as a plain
+        requests.Response (uncached) unless Cloudflare challenges them.
         """
+        use_cache = not kwargs.get("no_cache")
+        if use_cache:
+            cached = self._cache_lookup(url)
+            if cached is not None:
+                return cached
+
+        if _DIRECT_BYPASS.search(url):
+            direct = self._get_direct(url, kwargs.get('timeout', 15))
+            if direct is not None:
+                return direct
+
         # Ensure we have a session
         if not self._session_id:
             if not self.create_session():
@@ -97,9 +303,7 @@ class FlareSolverrSession:
         try:
             # We use a longer timeout for the actual HTTP call to FS
             request_timeout = kwargs.get('timeout', 120)
-            resp = requests.post(self.flaresolverr_url, json=payload, timeout=request_timeout)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._post_command(payload, request_timeout)
 
             if data.get("status") != "ok":
                 # If session is invalid, try to recreate it once
@@ -110,16 +314,17 @@ class FlareSolverrSession:
                     if self.create_session():
                         # Retry the request
                         payload["session"] = self._session_id
-                        resp = requests.post(self.flaresolverr_url, json=payload, timeout=request_timeout)
-                        resp.raise_for_status()
-                        data = resp.json()
+                        data = self._post_command(payload, request_timeout)
                 
                 if data.get("status") != "ok":
                     error_detail = data.get('message', 'Unknown error')
                     raise ConnectionError(f"FlareSolverr error: {error_detail}")
 
             self._last_used = time.time()
-            return FakeSolverrResponse(data["solution"])
+            response = FakeSolverrResponse(data["solution"])
+            if use_cache and 200 <= response.status_code < 300:
+                self._cache_store(url, response)
+            return response
 
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(
@@ -132,12 +337,55 @@ class FlareSolverrSession:
                 f"The site might be very slow or FlareSolverr is overloaded."
             )
 
+    def get_many(self, urls: List[str], max_workers: int = 4, **kwargs) -> list:
+        """
+        Fetch several URLs through FlareSolverr concurrently.
+        FlareSolverr serves parallel requests on one browser session and each
+        worker just waits on a socket, so threads give real parallelism.
+        Returns FakeSolverrResponse objects in the same order as `urls`;
+        the first failure is re-raised once every fetch has finished.
+        """
+        if not urls:
+            return []
+
+        # Create the session up front so workers don't race to create several
+        if not self._session_id and not self.create_session():
+            raise ConnectionError(
+                "FlareSolverr is not running see README.md for setup instructions.\n"
+                "💡 Quick start: python start_flaresolverr.py\n"
+                "Or start it manually: python FlareSolverr/src/flaresolverr.py"
+            )
+
+        max_workers = max(1, min(max_workers, HTTP_POOL_MAXSIZE))
+        if self._pool is None or self._pool_workers != max_workers:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+            self._pool_workers = max_workers
+
+        results = [None] * len(urls)
+        first_error = None
+        future_to_index = {
+            self._pool.submit(self.get, url, **kwargs): i for i, url in enumerate(urls)
+        }
+        for future in as_completed(future_to_index):
+            try:
+                results[future_to_index[future]] = future.result()
+            except Exception as e:
+                if first_error is None:
+                    first_error = e
+
+        if first_error is not None:
+            raise first_error
+        return results
+
+
 class FakeSolverrResponse:
     """Mimics requests.Response using FlareSolverr output."""
 
     def __init__(self, solution: dict):
         self.text = solution.get("response", "")
-        self.content = self.text.encode('utf-8') if isinstance(self.text, str) else self.text
+        self._content = None  # encoded on first access to .content
         self.status_code = solution.get("status", 200)
         self.url = solution.get("url", "")
         
@@ -153,6 +401,13 @@ class FakeSolverrResponse:
         self.headers = solution.get("headers", {})
         self.reason = solution.get("statusText", "")
 
+    @property
+    def content(self) -> bytes:
+        """UTF-8 body bytes, encoded lazily — most callers only read .text."""
+        if self._content is None:
+            self._content = self.text.encode('utf-8') if isinstance(self.text, str) else self.text
+        return self._content
+
     def raise_for_status(self) -> None:
         """Raise HTTPError if status code indicates an error."""
         if not self.ok:
@@ -163,16 +418,61 @@ class FakeSolverrResponse:
     
     def json(self):
         """Parse JSON response."""
-        import json
         if not self.text:
             raise ValueError("No JSON content to parse")
-        return json.loads(self.text)
+        # Both decoders take str, so the body is never encoded just to be parsed
+        return _loads(self.text)
+
+# url -> {"ts": last probe, "ok": result, "http_ts": last full /health check}
+_health_cache: dict = {}
+_health_lock = Lock()
+
+
+def invalidate_health_cache() -> None:
+    """Force the next is_flaresolverr_running() call to probe again."""
+    with _health_lock:
+        _health_cache.clear()
+
 
 def is_flaresolverr_running(flaresolverr_url: str = FLARESOLVERR_URL) -> bool:
-    """Quick health check to see if FlareSolverr is running."""
+    """
+    Quick health check to see if FlareSolverr is running.
+    Safe to call from UI code: results are cached for HEALTH_CACHE_TTL seconds,
+    and a closed port is detected with a short TCP connect instead of a 2s
+    HTTP timeout. The HTTP /health endpoint is only hit when the port is open
+    and the last full check is older than HEALTH_REVALIDATE seconds.
+    """
+    now = time.monotonic()
+    with _health_lock:
+        entry = _health_cache.get(flaresolverr_url)
+        if entry and now - entry["ts"] < HEALTH_CACHE_TTL:
+            return entry["ok"]
+
+    parsed = urlparse(flaresolverr_url)
+    host = parsed.hostname or "localhost"
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+
+    http_ts = entry["http_ts"] if entry else 0.0
     try:
-        health_url = flaresolverr_url.replace('/v1', '') + '/health'
-        r = requests.get(health_url, timeout=2)
-        return r.status_code == 200
-    except requests.exceptions.RequestException:
-        return False
+        with socket.create_connection((host, port), timeout=HEALTH_CONNECT_TIMEOUT):
+            pass
+    except OSError:
+        ok = False
+    else:
+        if entry and entry["ok"] and now - http_ts < HEALTH_REVALIDATE:
+            ok = True
+        else:
+            try:
+                if flaresolverr_url == FLARESOLVERR_URL:
+                    health_url = _FLARESOLVERR_HEALTH_URL
+                else:
+                    health_url = flaresolverr_url.rsplit('/v1', 1)[0] + '/health'
+                r = _health_session.get(health_url, timeout=2)
+                ok = r.status_code == 200
+            except requests.exceptions.RequestException:
+                ok = False
+            http_ts = now
+
+    with _health_lock:
+        _health_cache[flaresolverr_url] = {"ts": now, "ok": ok, "http_ts": http_ts}
+    return ok
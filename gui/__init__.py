@@ -5,9 +5,10 @@ A sleek, animated manga downloader interface with tabbed navigation.
 
 import sys
 import os
+from functools import lru_cache
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFontDatabase, QFont
+from PyQt6.QtWidgets import QApplication, QSplashScreen
+from PyQt6.QtGui import QFontDatabase, QFont, QColor, QPixmap, QPixmapCache
 from PyQt6.QtCore import Qt
 
 # Add parent directory to path for imports
@@ -27,10 +28,28 @@ def run_gui():
     app.setApplicationVersion("2.0.0")
     app.setOrganizationName("WeebCentral")
     
+    # Room for recently shown covers (limit is in KB)
+    QPixmapCache.setCacheLimit(50 * 1024)
+    
+    # Get something on screen before the heavy imports below
+    # (gui.theme is plain constants, so it is cheap to import this early)
+    from gui.theme import Colors
+    splash_pixmap = QPixmap(360, 120)
+    splash_pixmap.fill(QColor(Colors.BG_DARKEST))  # A new QPixmap holds garbage until filled
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage(
+        "WeebCentral Downloader",
+        Qt.AlignmentFlag.AlignCenter,
+        QColor(Colors.NEON_CYAN)
+    )
+    splash.show()
+    app.processEvents()
+    
     # Load custom fonts
     _load_fonts()
     
-    # Import here to avoid circular imports
+    # Import here to avoid circular imports; this pulls in every tab,
+    # component and worker (requests, bs4, the scraper) so do it after the splash
     from gui.main_window import MainWindow
     from gui.theme import get_stylesheet
     
@@ -40,14 +59,22 @@ def run_gui():
     # Create and show main window
     window = MainWindow()
     window.show()
+    splash.finish(window)
     
     sys.exit(app.exec())
 
 
+@lru_cache(maxsize=1)
 def _load_fonts():
-    """Load custom fonts for the application."""
+    """Load custom fonts for the application (only once per process)."""
     fonts_dir = os.path.join(os.path.dirname(__file__), "fonts")
     
+    # One directory read instead of a stat per font
+    try:
+        entries = set(os.listdir(fonts_dir))
+    except OSError:
+        return
+    
     # Try to load Outfit and Inter fonts if available
     font_files = [
         "Outfit-Regular.ttf",
@@ -58,9 +85,8 @@ def _load_fonts():
     ]
     
     for font_file in font_files:
-        font_path = os.path.join(fonts_dir, font_file)
-        if os.path.exists(font_path):
-            QFontDatabase.addApplicationFont(font_path)
+        if font_file in entries:
+            QFontDatabase.addApplicationFont(os.path.join(fonts_dir, font_file))
 
 
 if __name__ == "__main__":
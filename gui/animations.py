@@ -3,6 +3,9 @@ Animation utilities for the WeebCentral Downloader GUI.
 Provides smooth transitions, fade effects, and micro-interactions.
 """
 
+from functools import lru_cache
+from typing import Callable
+
 from PyQt6.QtCore import (
     QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
     QSequentialAnimationGroup, QPoint, QSize, Qt, pyqtProperty, QObject
@@ -13,6 +16,12 @@ from PyQt6.QtGui import QColor
 from gui.theme import Colors
 
 
+@lru_cache(maxsize=32)
+def _parse_color(color: str) -> QColor:
+    """Parse a hex/named color once; Qt copies it on setColor, so sharing is safe."""
+    return QColor(color)
+
+
 class AnimationDuration:
     """Standard animation durations in milliseconds."""
     INSTANT = 100
@@ -27,23 +36,20 @@ class AnimationMixin:
     
     def fade_in(self, duration: int = AnimationDuration.NORMAL):
         """Animate widget opacity from 0 to 1."""
-        effect = self._ensure_opacity_effect()
-        anim = QPropertyAnimation(effect, b"opacity", self)
-        anim.setDuration(duration)
-        anim.setStartValue(0.0)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        anim.start()
-        return anim
+        return self._run_fade(0.0, 1.0, duration, QEasingCurve.Type.OutCubic)
     
     def fade_out(self, duration: int = AnimationDuration.NORMAL):
         """Animate widget opacity from 1 to 0."""
-        effect = self._ensure_opacity_effect()
-        anim = QPropertyAnimation(effect, b"opacity", self)
+        return self._run_fade(1.0, 0.0, duration, QEasingCurve.Type.InCubic)
+    
+    def _run_fade(self, start: float, end: float, duration: int, curve) -> QPropertyAnimation:
+        """Restart the widget's fade animation with new parameters."""
+        anim = self._ensure_fade_animation()
+        anim.stop()
         anim.setDuration(duration)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        anim.setEasingCurve(QEasingCurve.Type.InCubic)
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        anim.setEasingCurve(curve)
         anim.start()
         return anim
     
@@ -54,6 +60,22 @@ class AnimationMixin:
             effect = QGraphicsOpacityEffect(self)
             self.setGraphicsEffect(effect)
         return effect
+    
+    def _ensure_fade_animation(self) -> QPropertyAnimation:
+        """Return the widget's fade animation, creating it on first use."""
+        anim = getattr(self, "_fade_anim", None)
+        if self.isWindow():
+            # Top-level windows fade natively, no offscreen effect needed
+            if anim is None or anim.targetObject() is not self:
+                anim = QPropertyAnimation(self, b"windowOpacity", self)
+                self._fade_anim = anim
+            return anim
+        effect = self._ensure_opacity_effect()
+        # Rebuild if the opacity effect was replaced since the last fade
+        if anim is None or anim.targetObject() is not effect:
+            anim = QPropertyAnimation(effect, b"opacity", self)
+            self._fade_anim = anim
+        return anim
 
 
 def create_fade_animation(
@@ -62,13 +84,21 @@ def create_fade_animation(
     end: float = 1.0,
     duration: int = AnimationDuration.NORMAL
 ) -> QPropertyAnimation:
-    """Create a fade animation for a widget."""
-    effect = widget.graphicsEffect()
-    if not isinstance(effect, QGraphicsOpacityEffect):
-        effect = QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
+    """
+    Create a fade animation for a widget.
+    Top-level windows fade through windowOpacity, which the window system
+    composites natively. Child widgets need a QGraphicsOpacityEffect, which
+    renders the widget into an offscreen buffer of its full size every frame.
+    """
+    if widget.isWindow():
+        anim = QPropertyAnimation(widget, b"windowOpacity", widget)
+    else:
+        effect = widget.graphicsEffect()
+        if not isinstance(effect, QGraphicsOpacityEffect):
+            effect = QGraphicsOpacityEffect(widget)
+            widget.setGraphicsEffect(effect)
+        anim = QPropertyAnimation(effect, b"opacity", widget)
     
-    anim = QPropertyAnimation(effect, b"opacity", widget)
     anim.setDuration(duration)
     anim.setStartValue(start)
     anim.setEndValue(end)
@@ -106,17 +136,105 @@ def create_size_animation(
     return anim
 
 
+def make_glow_effect_factory(
+    color: str = Colors.NEON_CYAN,
+    blur_radius: int = 20,
+    offset: tuple = (0, 0)
+) -> Callable[[], QGraphicsDropShadowEffect]:
+    """
+    Return a zero-argument factory for identical glow effects.
+    Effects can't be shared between widgets, but the color is parsed once.
+    """
+    qcolor = _parse_color(color)
+    dx, dy = offset
+    
+    def factory() -> QGraphicsDropShadowEffect:
+        effect = QGraphicsDropShadowEffect()
+        effect.setColor(qcolor)
+        effect.setBlurRadius(blur_radius)
+        effect.setOffset(dx, dy)
+        return effect
+    
+    return factory
+
+
 def create_glow_effect(
     color: str = Colors.NEON_CYAN,
     blur_radius: int = 20,
     offset: tuple = (0, 0)
 ) -> QGraphicsDropShadowEffect:
-    """Create a glow/shadow effect."""
-    effect = QGraphicsDropShadowEffect()
-    effect.setColor(QColor(color))
-    effect.setBlurRadius(blur_radius)
-    effect.setOffset(offset[0], offset[1])
-    return effect
+    """
+    Create a glow/shadow effect.
+    Meant for effects that stay attached; hover/focus glows should use
+    GlowController, which only attaches an effect while it is visible.
+    """
+    return make_glow_effect_factory(color, blur_radius, offset)()
+
+
+class GlowController:
+    """
+    Drop-shadow glow for one widget, shared by the animated buttons/inputs
+    and GlowAnimator. The effect is attached only while the glow is visible
+    and animates its own blurRadius, so no wrapper property is needed.
+    """
+    
+    __slots__ = ("_widget", "_color", "effect", "anim", "__weakref__")
+    
+    def __init__(self, widget: QWidget, color: str = Colors.NEON_CYAN):
+        self._widget = widget
+        self._color = _parse_color(color)
+        self.effect = None
+        self.anim = None
+    
+    @property
+    def radius(self) -> float:
+        return self.effect.blurRadius() if self.effect is not None else 0.0
+    
+    def set_color(self, color: str):
+        """Set the glow color."""
+        self._color = _parse_color(color)
+        if self.effect is not None:
+            self.effect.setColor(self._color)
+    
+    def ensure_effect(self) -> QGraphicsDropShadowEffect:
+        """Attach the glow effect if it isn't already."""
+        if self.effect is None:
+            self.effect = QGraphicsDropShadowEffect(self._widget)
+            self.effect.setColor(self._color)
+            self.effect.setOffset(0, 0)
+            self.effect.setBlurRadius(0)
+            self._widget.setGraphicsEffect(self.effect)
+        return self.effect
+    
+    def set_radius(self, radius: float):
+        """Jump straight to a blur radius."""
+        if radius > 0 or self.effect is not None:
+            self.ensure_effect().setBlurRadius(radius)
+    
+    def animate_to(self, radius: float, duration: int = AnimationDuration.NORMAL):
+        """Animate the glow to `radius`; fading to 0 detaches the effect."""
+        if self.effect is None and radius <= 0:
+            return
+        effect = self.ensure_effect()
+        if self.anim is None:
+            # Parented to the widget so it survives the effect being dropped
+            self.anim = QPropertyAnimation(self._widget)
+            self.anim.setPropertyName(b"blurRadius")
+            self.anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self.anim.finished.connect(self.detach_if_idle)
+        self.anim.stop()
+        self.anim.setTargetObject(effect)
+        self.anim.setDuration(duration)
+        self.anim.setStartValue(effect.blurRadius())
+        self.anim.setEndValue(float(radius))
+        self.anim.start()
+    
+    def detach_if_idle(self):
+        """Remove the glow effect once it has faded out."""
+        if self.effect is not None and self.effect.blurRadius() <= 0:
+            effect, self.effect = self.effect, None
+            if self._widget.graphicsEffect() is effect:
+                self._widget.setGraphicsEffect(None)  # Qt deletes the old effect
 
 
 class GlowAnimator(QObject):
@@ -125,42 +243,23 @@ class GlowAnimator(QObject):
     def __init__(self, widget: QWidget, color: str = Colors.NEON_CYAN):
         super().__init__(widget)
         self._widget = widget
-        self._color = color
-        self._blur_radius = 0
-        
-        self._effect = QGraphicsDropShadowEffect(widget)
-        self._effect.setColor(QColor(color))
-        self._effect.setOffset(0, 0)
-        self._effect.setBlurRadius(0)
-        widget.setGraphicsEffect(self._effect)
-        
-        self._animation = QPropertyAnimation(self, b"blurRadius", self)
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._glow = GlowController(widget, color)
     
     @pyqtProperty(float)
     def blurRadius(self) -> float:
-        return self._blur_radius
+        return self._glow.radius
     
     @blurRadius.setter
     def blurRadius(self, value: float):
-        self._blur_radius = value
-        self._effect.setBlurRadius(value)
+        self._glow.set_radius(value)
     
     def glow_in(self, target: float = 25, duration: int = AnimationDuration.NORMAL):
         """Animate glow to target intensity."""
-        self._animation.stop()
-        self._animation.setDuration(duration)
-        self._animation.setStartValue(self._blur_radius)
-        self._animation.setEndValue(target)
-        self._animation.start()
+        self._glow.animate_to(target, duration)
     
     def glow_out(self, duration: int = AnimationDuration.NORMAL):
         """Animate glow to zero."""
-        self._animation.stop()
-        self._animation.setDuration(duration)
-        self._animation.setStartValue(self._blur_radius)
-        self._animation.setEndValue(0)
-        self._animation.start()
+        self._glow.animate_to(0, duration)
 
 
 class PulseAnimator(QObject):
@@ -198,45 +297,24 @@ class PulseAnimator(QObject):
         self._glow.glow_out()
 
 
-def animate_button_press(widget: QWidget, duration: int = AnimationDuration.FAST):
-    """Animate a button press effect (scale down and back)."""
-    original_size = widget.size()
-    pressed_size = QSize(
-        int(original_size.width() * 0.95),
-        int(original_size.height() * 0.95)
-    )
-    
-    group = QSequentialAnimationGroup(widget)
-    
-    # Scale down
-    anim_down = create_size_animation(widget, original_size, pressed_size, duration // 2)
-    group.addAnimation(anim_down)
-    
-    # Scale up
-    anim_up = create_size_animation(widget, pressed_size, original_size, duration // 2)
-    group.addAnimation(anim_up)
-    
-    group.start()
-    return group
-
-
 def stagger_animations(
     animations: list,
     stagger_delay: int = 50
-) -> QSequentialAnimationGroup:
-    """Create staggered animation group with delays between items."""
-    from PyQt6.QtCore import QPauseAnimation
-    
-    group = QSequentialAnimationGroup()
+) -> QParallelAnimationGroup:
+    """
+    Create a staggered animation group: item i starts i * stagger_delay ms
+    after the first, overlapping with the ones before it.
+    """
+    group = QParallelAnimationGroup()
     
     for i, anim in enumerate(animations):
-        if i > 0:
-            pause = QPauseAnimation(stagger_delay)
-            group.addAnimation(pause)
-        
-        # Wrap each animation in a parallel group to run simultaneously
-        parallel = QParallelAnimationGroup()
-        parallel.addAnimation(anim)
-        group.addAnimation(parallel)
+        if i == 0:
+            group.addAnimation(anim)
+            continue
+        # A pre-roll pause is all each later item needs; no per-item wrapper groups
+        delayed = QSequentialAnimationGroup(group)
+        delayed.addPause(i * stagger_delay)
+        delayed.addAnimation(anim)
+        group.addAnimation(delayed)
     
     return group
@@ -3,11 +3,46 @@ Animated Button Components.
 Custom buttons with hover glow, press effects, and gradient backgrounds.
 """
 
-from PyQt6.QtWidgets import QPushButton, QGraphicsDropShadowEffect
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QColor, QCursor
+from PyQt6.QtWidgets import QPushButton
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QCursor
 
 from gui.theme import Colors, Spacing
+from gui.animations import GlowController
+
+# Shared per-class stylesheets: one identical string lets Qt reuse the parsed QSS
+_ICON_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Colors.BG_LIGHT};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_MD}px;
+        font-size: 18px;
+    }}
+    QPushButton:hover {{
+        background-color: {Colors.BG_HOVER};
+        border-color: {Colors.NEON_CYAN};
+    }}
+"""
+
+_NAV_BUTTON_QSS = f"""
+    QPushButton#nav-button {{
+        text-align: left;
+        padding-left: {Spacing.LG}px;
+        font-size: 14px;
+        background: transparent;
+        border: none;
+        border-radius: {Spacing.RADIUS_MD}px;
+        color: {Colors.TEXT_SECONDARY};
+    }}
+    QPushButton#nav-button:hover {{
+        background-color: {Colors.BG_HOVER};
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QPushButton#nav-button:checked {{
+        background: {Colors.GRADIENT_PRIMARY};
+        color: {Colors.TEXT_PRIMARY};
+    }}
+"""
 
 
 class AnimatedButton(QPushButton):
@@ -21,46 +56,22 @@ class AnimatedButton(QPushButton):
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.setMinimumHeight(44)
         
-        # Glow effect
-        self._glow_radius = 0
-        self._shadow = QGraphicsDropShadowEffect(self)
-        self._shadow.setColor(QColor(Colors.NEON_CYAN))
-        self._shadow.setOffset(0, 0)
-        self._shadow.setBlurRadius(0)
-        self.setGraphicsEffect(self._shadow)
-        
-        # Hover animation
-        self._hover_anim = QPropertyAnimation(self, b"glowRadius", self)
-        self._hover_anim.setDuration(200)
-        self._hover_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-    
-    @pyqtProperty(float)
-    def glowRadius(self) -> float:
-        return self._glow_radius
-    
-    @glowRadius.setter
-    def glowRadius(self, value: float):
-        self._glow_radius = value
-        self._shadow.setBlurRadius(value)
+        # Hover glow, attached only while glowing so idle buttons
+        # don't each pay for an offscreen-rendered shadow
+        self._glow = GlowController(self, Colors.NEON_CYAN)
     
     def set_glow_color(self, color: str):
         """Set the glow effect color."""
-        self._shadow.setColor(QColor(color))
+        self._glow.set_color(color)
     
     def enterEvent(self, event):
         """Handle mouse enter - start glow animation."""
-        self._hover_anim.stop()
-        self._hover_anim.setStartValue(self._glow_radius)
-        self._hover_anim.setEndValue(20)
-        self._hover_anim.start()
+        self._glow.animate_to(20, 200)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Handle mouse leave - fade out glow."""
-        self._hover_anim.stop()
-        self._hover_anim.setStartValue(self._glow_radius)
-        self._hover_anim.setEndValue(0)
-        self._hover_anim.start()
+        self._glow.animate_to(0, 200)
         super().leaveEvent(event)
 
 
@@ -107,18 +118,7 @@ class IconButton(AnimatedButton):
     def __init__(self, icon_text: str = "", parent=None):
         super().__init__(icon_text, parent)
         self.setFixedSize(44, 44)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.BG_LIGHT};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_MD}px;
-                font-size: 18px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.BG_HOVER};
-                border-color: {Colors.NEON_CYAN};
-            }}
-        """)
+        self.setStyleSheet(_ICON_BUTTON_QSS)
 
 
 class NavButton(AnimatedButton):
@@ -142,42 +142,18 @@ class NavButton(AnimatedButton):
             self.setText(text)
         
         # Left-align text
-        self.setStyleSheet(f"""
-            QPushButton#nav-button {{
-                text-align: left;
-                padding-left: {Spacing.LG}px;
-                font-size: 14px;
-                background: transparent;
-                border: none;
-                border-radius: {Spacing.RADIUS_MD}px;
-                color: {Colors.TEXT_SECONDARY};
-            }}
-            QPushButton#nav-button:hover {{
-                background-color: {Colors.BG_HOVER};
-                color: {Colors.TEXT_PRIMARY};
-            }}
-            QPushButton#nav-button:checked {{
-                background: {Colors.GRADIENT_PRIMARY};
-                color: {Colors.TEXT_PRIMARY};
-            }}
-        """)
+        self.setStyleSheet(_NAV_BUTTON_QSS)
         
         # Custom glow for nav buttons
         self.set_glow_color(Colors.NEON_CYAN)
     
     def enterEvent(self, event):
         """Subtle glow on hover for nav buttons."""
-        self._hover_anim.stop()
-        self._hover_anim.setStartValue(self._glow_radius)
-        self._hover_anim.setEndValue(10)
-        self._hover_anim.start()
+        self._glow.animate_to(10, 200)
         # Skip parent's enterEvent to avoid double animation
         QPushButton.enterEvent(self, event)
     
     def leaveEvent(self, event):
         """Fade out glow."""
-        self._hover_anim.stop()
-        self._hover_anim.setStartValue(self._glow_radius)
-        self._hover_anim.setEndValue(0)
-        self._hover_anim.start()
+        self._glow.animate_to(0, 200)
         QPushButton.leaveEvent(self, event)
@@ -3,16 +3,44 @@ Animated Input Component.
 Modern text input with focus glow and clear button.
 """
 
-from PyQt6.QtWidgets import (
-    QLineEdit, QHBoxLayout, QPushButton, QWidget, 
-    QGraphicsDropShadowEffect
-)
-from PyQt6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal
-)
-from PyQt6.QtGui import QColor, QCursor
+from PyQt6.QtWidgets import QLineEdit, QHBoxLayout, QPushButton, QWidget
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QCursor
 
 from gui.theme import Colors, Spacing
+from gui.animations import GlowController
+
+# Built once at import so every instance passes Qt the same QSS string
+_INPUT_BUTTON_QSS = f"""
+    QPushButton {{
+        background: {Colors.GRADIENT_PRIMARY};
+        border: none;
+        border-radius: {Spacing.RADIUS_MD}px;
+        color: {Colors.TEXT_PRIMARY};
+        font-weight: bold;
+        padding: 0 {Spacing.LG}px;
+    }}
+    QPushButton:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+            stop:0 #00E5FF, stop:1 #FF1AE8);
+    }}
+    QPushButton:pressed {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+            stop:0 #00C4DB, stop:1 #DB00C4);
+    }}
+"""
+
+_SEARCH_INPUT_QSS = f"""
+    QLineEdit {{
+        padding-left: {Spacing.XL}px;
+        background-color: {Colors.BG_LIGHT};
+        border: 2px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_MD}px;
+    }}
+    QLineEdit:focus {{
+        border-color: {Colors.NEON_CYAN};
+    }}
+"""
 
 
 class AnimatedInput(QLineEdit):
@@ -26,42 +54,17 @@ class AnimatedInput(QLineEdit):
         self.setPlaceholderText(placeholder)
         self.setMinimumHeight(48)
         
-        # Glow effect for focus
-        self._glow_radius = 0
-        self._shadow = QGraphicsDropShadowEffect(self)
-        self._shadow.setColor(QColor(Colors.NEON_CYAN))
-        self._shadow.setOffset(0, 0)
-        self._shadow.setBlurRadius(0)
-        self.setGraphicsEffect(self._shadow)
-        
-        # Focus animation
-        self._focus_anim = QPropertyAnimation(self, b"glowRadius", self)
-        self._focus_anim.setDuration(200)
-        self._focus_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-    
-    @pyqtProperty(float)
-    def glowRadius(self) -> float:
-        return self._glow_radius
-    
-    @glowRadius.setter
-    def glowRadius(self, value: float):
-        self._glow_radius = value
-        self._shadow.setBlurRadius(value)
+        # Focus glow, attached only while focused
+        self._glow = GlowController(self, Colors.NEON_CYAN)
     
     def focusInEvent(self, event):
         """Handle focus in - start glow animation."""
-        self._focus_anim.stop()
-        self._focus_anim.setStartValue(self._glow_radius)
-        self._focus_anim.setEndValue(15)
-        self._focus_anim.start()
+        self._glow.animate_to(15, 200)
         super().focusInEvent(event)
     
     def focusOutEvent(self, event):
         """Handle focus out - fade out glow."""
-        self._focus_anim.stop()
-        self._focus_anim.setStartValue(self._glow_radius)
-        self._focus_anim.setEndValue(0)
-        self._focus_anim.start()
+        self._glow.animate_to(0, 200)
         super().focusOutEvent(event)
 
 
@@ -100,24 +103,7 @@ class InputWithButton(QWidget):
         self._button.setMinimumHeight(48)
         self._button.setMinimumWidth(100)
         self._button.clicked.connect(self.buttonClicked.emit)
-        self._button.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.GRADIENT_PRIMARY};
-                border: none;
-                border-radius: {Spacing.RADIUS_MD}px;
-                color: {Colors.TEXT_PRIMARY};
-                font-weight: bold;
-                padding: 0 {Spacing.LG}px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #00E5FF, stop:1 #FF1AE8);
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #00C4DB, stop:1 #DB00C4);
-            }}
-        """)
+        self._button.setStyleSheet(_INPUT_BUTTON_QSS)
         layout.addWidget(self._button)
     
     def text(self) -> str:
@@ -152,17 +138,7 @@ class SearchInput(AnimatedInput):
     
     def __init__(self, placeholder: str = "Search...", parent=None):
         super().__init__(placeholder, parent)
-        self.setStyleSheet(f"""
-            QLineEdit {{
-                padding-left: {Spacing.XL}px;
-                background-color: {Colors.BG_LIGHT};
-                border: 2px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_MD}px;
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.NEON_CYAN};
-            }}
-        """)
+        self.setStyleSheet(_SEARCH_INPUT_QSS)
 
 
 class PathInput(InputWithButton):
@@ -5,17 +5,113 @@ Styled list widget for manga chapter selection with checkboxes and range input.
 
 from typing import List, Optional
 from dataclasses import dataclass
+from itertools import compress
+from operator import or_, xor
 import re
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QListView,
     QPushButton, QLabel, QLineEdit, QFrame, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QTimer, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt6.QtGui import QCursor
 
 from gui.theme import Colors, Spacing
 
+# Range input like "1-50" or "1,5,10-20": whole-input check, then one term at a time
+_RANGE_TERM_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+_RANGE_INPUT_RE = re.compile(r"\s*\d+(?:\s*-\s*\d+)?\s*(?:,\s*\d+(?:\s*-\s*\d+)?\s*)*")
+
+
+_TOOLBAR_QSS = f"""
+    QFrame {{
+        background-color: {Colors.BG_MEDIUM};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_MD}px;
+        padding: {Spacing.SM}px;
+    }}
+"""
+
+_LINE_EDIT_QSS = f"""
+    QLineEdit {{
+        background-color: {Colors.BG_LIGHT};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_SM}px;
+        padding: {Spacing.SM}px;
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QLineEdit:focus {{
+        border-color: {Colors.NEON_CYAN};
+    }}
+"""
+
+_TOOL_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Colors.BG_LIGHT};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_SM}px;
+        padding: {Spacing.SM}px {Spacing.MD}px;
+        color: {Colors.TEXT_PRIMARY};
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        background-color: {Colors.BG_HOVER};
+        border-color: {Colors.NEON_CYAN};
+    }}
+"""
+
+_RANGE_LABEL_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: 12px;
+    }}
+"""
+
+_APPLY_BUTTON_QSS = f"""
+    QPushButton {{
+        background: {Colors.GRADIENT_PRIMARY};
+        border: none;
+        border-radius: {Spacing.RADIUS_SM}px;
+        padding: {Spacing.SM}px {Spacing.MD}px;
+        color: {Colors.TEXT_PRIMARY};
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00E5FF, stop:1 #FF1AE8);
+    }}
+"""
+
+_LIST_QSS = f"""
+    QListView {{
+        background-color: {Colors.BG_MEDIUM};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_MD}px;
+        padding: {Spacing.SM}px;
+        outline: none;
+    }}
+    QListView::item {{
+        background-color: transparent;
+        color: {Colors.TEXT_PRIMARY};
+        padding: {Spacing.SM}px {Spacing.MD}px;
+        border-radius: {Spacing.RADIUS_SM}px;
+        margin: 2px 0;
+    }}
+    QListView::item:hover {{
+        background-color: {Colors.BG_HOVER};
+    }}
+"""
+
+_COUNT_LABEL_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_MUTED};
+        font-size: 12px;
+        padding: {Spacing.SM}px;
+    }}
+"""
+
 
 @dataclass
 class ChapterItem:
@@ -25,6 +121,113 @@ class ChapterItem:
     index: int = 0
 
 
+class _ChapterListModel(QAbstractListModel):
+    """
+    Checkable chapter names backed by plain arrays.
+    The view only asks for the rows it paints, so no per-row objects exist.
+    """
+    
+    checksChanged = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self.selected = bytearray()  # 1 per checked row
+        self.selected_count = 0
+    
+    def set_names(self, names: List[str]):
+        """Replace all rows, unchecked."""
+        self.beginResetModel()
+        self._names = names
+        self.selected = bytearray(len(names))
+        self.selected_count = 0
+        self.endResetModel()
+        self.checksChanged.emit()
+    
+    def set_mask(self, mask: bytearray):
+        """Replace every check state at once with a single dataChanged."""
+        self.selected = mask
+        self.selected_count = mask.count(1)
+        if self._names:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._names) - 1),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+        self.checksChanged.emit()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self.selected[index.row()] else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole:
+            # Rows line up with ChapterListWidget._names; hand out the index, not the item
+            return index.row()
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
+        row = index.row()
+        if checked != bool(self.selected[row]):
+            self.selected[row] = checked
+            self.selected_count += 1 if checked else -1
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+            self.checksChanged.emit()
+        return True
+
+
+class _ChapterFilterModel(QSortFilterProxyModel):
+    """
+    Name filter over _ChapterListModel.
+    Qt keeps the visible-row mapping, so the view never hides rows one by one.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setDynamicSortFilter(False)  # Check toggles never change what matches
+        self.needle = ""
+        self._names_folded: List[str] = []
+    
+    def set_names_folded(self, names_folded: List[str], needle: Optional[str] = None):
+        """
+        Case-folded names, row-aligned with the source, and optionally a new needle.
+        Set before resetting the source; the reset filters the new rows once.
+        """
+        self._names_folded = names_folded
+        if needle is not None:
+            self.needle = needle
+    
+    def set_needle(self, needle: str):
+        """Show only rows whose folded name contains needle."""
+        if needle != self.needle:
+            self.needle = needle
+            self.invalidateFilter()
+    
+    def visible_mask(self) -> bytearray:
+        """1 for every source row the filter currently shows."""
+        needle = self.needle
+        if not needle:
+            return bytearray(b"\x01" * len(self._names_folded))
+        return bytearray(needle in name for name in self._names_folded)
+    
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        if source_row >= len(self._names_folded):
+            return False  # Source not reset to the new names yet
+        return not self.needle or self.needle in self._names_folded[source_row]
+
+
 class ChapterListWidget(QWidget):
     """
     Chapter selection list with toolbar controls.
@@ -32,11 +235,30 @@ class ChapterListWidget(QWidget):
     """
     
     selectionChanged = pyqtSignal(list)  # Emits list of selected ChapterItems
+    selectionCountChanged = pyqtSignal(int)  # Emits number of selected chapters
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._chapters: List[ChapterItem] = []
+        # Row-aligned with the model's check mask; ChapterItems are built only for selected rows
+        self._names: List[str] = []
+        self._urls: List[str] = []
+        
+        # Coalesces bursts of check changes into one selectionChanged emission
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._emit_selection)
+        
         self._setup_ui()
+        
+        # Filter once typing pauses instead of on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(
+            lambda: self._filter_chapters(self._filter_input.text())
+        )
+        self._filter_input.textChanged.connect(self._filter_timer.start)
     
     def _setup_ui(self):
         """Initialize the UI components."""
@@ -46,14 +268,7 @@ class ChapterListWidget(QWidget):
         
         # Toolbar
         toolbar = QFrame()
-        toolbar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_MEDIUM};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_MD}px;
-                padding: {Spacing.SM}px;
-            }}
-        """)
+        toolbar.setStyleSheet(_TOOLBAR_QSS)
         toolbar_layout = QVBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(Spacing.SM, Spacing.SM, Spacing.SM, Spacing.SM)
         toolbar_layout.setSpacing(Spacing.SM)
@@ -65,51 +280,24 @@ class ChapterListWidget(QWidget):
         # Search/filter
         self._filter_input = QLineEdit()
         self._filter_input.setPlaceholderText("🔍 Filter chapters...")
-        self._filter_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {Colors.BG_LIGHT};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_SM}px;
-                padding: {Spacing.SM}px;
-                color: {Colors.TEXT_PRIMARY};
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.NEON_CYAN};
-            }}
-        """)
-        self._filter_input.textChanged.connect(self._filter_chapters)
+        self._filter_input.setStyleSheet(_LINE_EDIT_QSS)
         row1.addWidget(self._filter_input)
         
         # Selection buttons
-        btn_style = f"""
-            QPushButton {{
-                background-color: {Colors.BG_LIGHT};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_SM}px;
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.BG_HOVER};
-                border-color: {Colors.NEON_CYAN};
-            }}
-        """
-        
         self._btn_all = QPushButton("Select All")
-        self._btn_all.setStyleSheet(btn_style)
+        self._btn_all.setStyleSheet(_TOOL_BUTTON_QSS)
         self._btn_all.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._btn_all.clicked.connect(self._select_all)
         row1.addWidget(self._btn_all)
         
         self._btn_none = QPushButton("Deselect All")
-        self._btn_none.setStyleSheet(btn_style)
+        self._btn_none.setStyleSheet(_TOOL_BUTTON_QSS)
         self._btn_none.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._btn_none.clicked.connect(self._deselect_all)
         row1.addWidget(self._btn_none)
         
         self._btn_invert = QPushButton("Invert")
-        self._btn_invert.setStyleSheet(btn_style)
+        self._btn_invert.setStyleSheet(_TOOL_BUTTON_QSS)
         self._btn_invert.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._btn_invert.clicked.connect(self._invert_selection)
         row1.addWidget(self._btn_invert)
@@ -121,46 +309,17 @@ class ChapterListWidget(QWidget):
         row2.setSpacing(Spacing.SM)
         
         range_label = QLabel("Select Range:")
-        range_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: 12px;
-            }}
-        """)
+        range_label.setStyleSheet(_RANGE_LABEL_QSS)
         row2.addWidget(range_label)
         
         self._range_input = QLineEdit()
         self._range_input.setPlaceholderText("e.g., 1-50 or 1,5,10-20")
         self._range_input.setMinimumWidth(180)
-        self._range_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {Colors.BG_LIGHT};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_SM}px;
-                padding: {Spacing.SM}px;
-                color: {Colors.TEXT_PRIMARY};
-            }}
-            QLineEdit:focus {{
-                border-color: {Colors.NEON_CYAN};
-            }}
-        """)
+        self._range_input.setStyleSheet(_LINE_EDIT_QSS)
         row2.addWidget(self._range_input)
         
         self._btn_apply_range = QPushButton("Apply Range")
-        self._btn_apply_range.setStyleSheet(f"""
-            QPushButton {{
-                background: {Colors.GRADIENT_PRIMARY};
-                border: none;
-                border-radius: {Spacing.RADIUS_SM}px;
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                color: {Colors.TEXT_PRIMARY};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00E5FF, stop:1 #FF1AE8);
-            }}
-        """)
+        self._btn_apply_range.setStyleSheet(_APPLY_BUTTON_QSS)
         self._btn_apply_range.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._btn_apply_range.clicked.connect(self._apply_range_selection)
         row2.addWidget(self._btn_apply_range)
@@ -171,97 +330,87 @@ class ChapterListWidget(QWidget):
         layout.addWidget(toolbar)
         
         # Chapter list
-        self._list = QListWidget()
+        self._model = _ChapterListModel(self)
+        self._model.checksChanged.connect(self._on_checks_changed)
+        self._proxy = _ChapterFilterModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._list = QListView()
+        self._list.setModel(self._proxy)
+        self._list.setUniformItemSizes(True)
         self._list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self._list.itemChanged.connect(self._on_item_changed)
-        self._list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {Colors.BG_MEDIUM};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_MD}px;
-                padding: {Spacing.SM}px;
-                outline: none;
-            }}
-            QListWidget::item {{
-                background-color: transparent;
-                color: {Colors.TEXT_PRIMARY};
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                border-radius: {Spacing.RADIUS_SM}px;
-                margin: 2px 0;
-            }}
-            QListWidget::item:hover {{
-                background-color: {Colors.BG_HOVER};
-            }}
-        """)
+        self._list.setStyleSheet(_LIST_QSS)
         layout.addWidget(self._list)
         
         # Selection count
         self._count_label = QLabel("0 chapters selected")
-        self._count_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: 12px;
-                padding: {Spacing.SM}px;
-            }}
-        """)
+        self._count_label.setStyleSheet(_COUNT_LABEL_QSS)
         layout.addWidget(self._count_label)
     
     def set_chapters(self, chapters: List[ChapterItem]):
         """Set the chapter list."""
-        self._chapters = chapters
-        self._list.clear()
-        
-        for chapter in chapters:
-            item = QListWidgetItem(chapter.name)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            item.setData(Qt.ItemDataRole.UserRole, chapter)
-            self._list.addItem(item)
-        
-        self._update_count()
+        self._set_rows(
+            [chapter.name for chapter in chapters],
+            [chapter.url for chapter in chapters]
+        )
+    
+    def set_chapter_dicts(self, chapters: List[dict]):
+        """Set the chapter list straight from scraped {"name", "url"} dicts."""
+        # The fallback name is only formatted for chapters that lack one
+        self._set_rows(
+            [ch.get("name") or f"Chapter {i+1}" for i, ch in enumerate(chapters)],
+            [ch.get("url", "") for ch in chapters]
+        )
+    
+    def _set_rows(self, names: List[str], urls: List[str]):
+        """Replace all rows with one model reset, filtered by whatever is typed right now."""
+        if names == self._names and urls == self._urls:
+            return  # Same chapters again (e.g. a re-fetch); keep the checks the user made
+        self._names = names
+        self._urls = urls
+        self._filter_timer.stop()
+        # Needle goes in with the names: invalidating now would filter the old rows
+        self._proxy.set_names_folded(
+            [name.casefold() for name in names],
+            self._filter_input.text().casefold()
+        )
+        self._model.set_names(names)
     
     def clear_chapters(self):
         """Clear all chapters."""
-        self._chapters = []
-        self._list.clear()
-        self._update_count()
+        self._names = []
+        self._urls = []
+        self._proxy.set_names_folded([])
+        self._model.set_names([])
     
     def get_selected_chapters(self) -> List[ChapterItem]:
         """Get list of selected chapters."""
-        selected = []
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                chapter = item.data(Qt.ItemDataRole.UserRole)
-                if chapter:
-                    selected.append(chapter)
-        return selected
+        names, urls = self._names, self._urls
+        return [
+            ChapterItem(name=names[i], url=urls[i], index=i)
+            for i in compress(range(len(names)), self._model.selected)
+        ]
+    
+    def _flush_filter(self):
+        """Apply a still-pending debounced filter before acting on visibility."""
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._filter_chapters(self._filter_input.text())
     
     def _select_all(self):
         """Select all visible chapters."""
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if not item.isHidden():
-                item.setCheckState(Qt.CheckState.Checked)
-        self._update_count()
+        self._flush_filter()
+        visible = self._proxy.visible_mask()
+        self._model.set_mask(bytearray(map(or_, self._model.selected, visible)))
     
     def _deselect_all(self):
         """Deselect all chapters."""
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            item.setCheckState(Qt.CheckState.Unchecked)
-        self._update_count()
+        self._model.set_mask(bytearray(len(self._names)))
     
     def _invert_selection(self):
         """Invert current selection."""
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if not item.isHidden():
-                if item.checkState() == Qt.CheckState.Checked:
-                    item.setCheckState(Qt.CheckState.Unchecked)
-                else:
-                    item.setCheckState(Qt.CheckState.Checked)
-        self._update_count()
+        self._flush_filter()
+        visible = self._proxy.visible_mask()
+        self._model.set_mask(bytearray(map(xor, self._model.selected, visible)))
     
     def _apply_range_selection(self):
         """Apply range selection from input field."""
@@ -269,54 +418,42 @@ class ChapterListWidget(QWidget):
         if not range_text:
             return
         
-        # Parse the range input (e.g., "1-50" or "1,5,10-20")
-        indices_to_select = set()
-        
-        try:
-            parts = range_text.replace(" ", "").split(",")
-            for part in parts:
-                if "-" in part:
-                    # Range like "1-50"
-                    start_end = part.split("-")
-                    if len(start_end) == 2:
-                        start = int(start_end[0])
-                        end = int(start_end[1])
-                        for i in range(start, end + 1):
-                            indices_to_select.add(i)
-                else:
-                    # Single number
-                    indices_to_select.add(int(part))
-        except ValueError:
+        if not _RANGE_INPUT_RE.fullmatch(range_text):
             return  # Invalid input, ignore
         
-        # Apply selection - indices are 1-based in input, 0-based in list
-        self._deselect_all()  # First deselect all
+        # Mark wanted rows in a bitmap - indices are 1-based in input, 0-based in list
+        count = len(self._names)
+        mask = bytearray(count)
+        for match in _RANGE_TERM_RE.finditer(range_text):
+            start = int(match.group(1)) - 1
+            end = int(match.group(2) or match.group(1)) - 1
+            start, end = max(start, 0), min(end, count - 1)
+            if start <= end:
+                mask[start:end + 1] = b"\x01" * (end - start + 1)
         
-        for i in range(self._list.count()):
-            # Check if 1-based index is in selection set
-            if (i + 1) in indices_to_select:
-                item = self._list.item(i)
-                item.setCheckState(Qt.CheckState.Checked)
-        
-        self._update_count()
+        # Everything outside the range ends up deselected
+        self._model.set_mask(mask)
     
+    @pyqtSlot(str)
     def _filter_chapters(self, text: str):
         """Filter chapters by name."""
-        text = text.lower()
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if text in item.text().lower():
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+        self._proxy.set_needle(text.casefold())
     
-    def _on_item_changed(self, item: QListWidgetItem):
-        """Handle item check state change."""
+    @pyqtSlot()
+    def _on_checks_changed(self):
+        """Handle check state changes from clicks or bulk actions."""
         self._update_count()
-        self.selectionChanged.emit(self.get_selected_chapters())
+        self._selection_timer.start()
+    
+    @pyqtSlot()
+    def _emit_selection(self):
+        """Emit the selection once per burst of changes."""
+        self.selectionCountChanged.emit(self._model.selected_count)
+        # Only build ChapterItems if someone wants the list
+        if self.receivers(self.selectionChanged):
+            self.selectionChanged.emit(self.get_selected_chapters())
     
     def _update_count(self):
         """Update the selection count label."""
-        selected = len(self.get_selected_chapters())
-        total = len(self._chapters)
-        self._count_label.setText(f"{selected} of {total} chapters selected")
+        total = len(self._names)
+        self._count_label.setText(f"{self._model.selected_count} of {total} chapters selected")
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
     QProgressBar, QPushButton, QGraphicsOpacityEffect
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QCursor
 
 from gui.theme import Colors, Spacing, Fonts
@@ -25,6 +25,89 @@ class DownloadStatus(Enum):
     CANCELLED = "cancelled"
 
 
+def _status_label_qss(color: str) -> str:
+    return f"""
+    QLabel {{
+        color: {color};
+        font-size: {Fonts.SIZE_SMALL}px;
+    }}
+"""
+
+
+# status -> (icon, label text, label stylesheet)
+_STATUS_DISPLAY = {
+    DownloadStatus.QUEUED: ("⏳", "Queued", _status_label_qss(Colors.TEXT_MUTED)),
+    DownloadStatus.DOWNLOADING: ("⬇️", "Downloading...", _status_label_qss(Colors.NEON_CYAN)),
+    DownloadStatus.COMPLETED: ("✅", "Completed", _status_label_qss(Colors.NEON_GREEN)),
+    DownloadStatus.ERROR: ("❌", "Error", _status_label_qss(Colors.NEON_RED)),
+    DownloadStatus.CANCELLED: ("⛔", "Cancelled", _status_label_qss(Colors.NEON_ORANGE)),
+}
+_UNKNOWN_STATUS_DISPLAY = ("❓", "Unknown", _status_label_qss(Colors.TEXT_MUTED))
+
+# Shared by every card; built once at import
+_CARD_QSS = f"""
+    QFrame#card {{
+        background-color: {Colors.BG_MEDIUM};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_LG}px;
+        padding: {Spacing.MD}px;
+    }}
+"""
+
+_NAME_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_PRIMARY};
+        font-weight: bold;
+        font-size: {Fonts.SIZE_BODY}px;
+    }}
+"""
+
+_RETRY_BTN_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        border: none;
+        color: {Colors.TEXT_MUTED};
+        font-size: 14px;
+        border-radius: 14px;
+    }}
+    QPushButton:hover {{
+        background-color: {Colors.NEON_CYAN};
+        color: {Colors.TEXT_PRIMARY};
+    }}
+"""
+
+_CANCEL_BTN_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        border: none;
+        color: {Colors.TEXT_MUTED};
+        font-size: 14px;
+        border-radius: 14px;
+    }}
+    QPushButton:hover {{
+        background-color: {Colors.NEON_RED};
+        color: {Colors.TEXT_PRIMARY};
+    }}
+"""
+
+_PROGRESS_QSS = f"""
+    QProgressBar {{
+        background-color: {Colors.BG_LIGHT};
+        border: none;
+        border-radius: {Spacing.RADIUS_SM}px;
+        text-align: center;
+        color: {Colors.TEXT_PRIMARY};
+        font-weight: bold;
+        font-size: {Fonts.SIZE_SMALL}px;
+        min-height: 20px;
+    }}
+    QProgressBar::chunk {{
+        background: {Colors.GRADIENT_PRIMARY};
+        border-radius: {Spacing.RADIUS_SM}px;
+    }}
+"""
+
+
 class DownloadCard(QFrame):
     """
     Card displaying download progress for a single chapter.
@@ -33,12 +116,21 @@ class DownloadCard(QFrame):
     
     cancelRequested = pyqtSignal(str)  # Emits chapter name
     retryRequested = pyqtSignal(str)  # Emits chapter name for retry
+    statusChanged = pyqtSignal(object, object)  # Emits (old, new) DownloadStatus
     
     def __init__(self, chapter_name: str, parent=None):
         super().__init__(parent)
         self._chapter_name = chapter_name
         self._status = DownloadStatus.QUEUED
         self._progress = 0
+        self._counts = (0, 0)  # (current, total) images from the last update
+        self._last_shown = (-1, 0, 0)  # What the progress bar currently displays
+        
+        # Progress is painted at most every 50 ms; the timer's tail shows the latest value
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._show_progress)
         
         self._setup_ui()
         self._setup_animations()
@@ -46,14 +138,7 @@ class DownloadCard(QFrame):
     def _setup_ui(self):
         """Initialize UI components."""
         self.setObjectName("card")
-        self.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {Colors.BG_MEDIUM};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_LG}px;
-                padding: {Spacing.MD}px;
-            }}
-        """)
+        self.setStyleSheet(_CARD_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(Spacing.LG, Spacing.MD, Spacing.LG, Spacing.MD)
@@ -70,42 +155,19 @@ class DownloadCard(QFrame):
         
         # Chapter name
         self._name_label = QLabel(self._chapter_name)
-        self._name_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-weight: bold;
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        self._name_label.setStyleSheet(_NAME_QSS)
         header.addWidget(self._name_label, 1)
         
         # Status text
         self._status_label = QLabel("Queued")
-        self._status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: {Fonts.SIZE_SMALL}px;
-            }}
-        """)
+        self._status_label.setStyleSheet(_STATUS_DISPLAY[DownloadStatus.QUEUED][2])
         header.addWidget(self._status_label)
         
         # Retry button (hidden by default)
         self._retry_btn = QPushButton("🔄")
         self._retry_btn.setFixedSize(28, 28)
         self._retry_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._retry_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {Colors.TEXT_MUTED};
-                font-size: 14px;
-                border-radius: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.NEON_CYAN};
-                color: {Colors.TEXT_PRIMARY};
-            }}
-        """)
+        self._retry_btn.setStyleSheet(_RETRY_BTN_QSS)
         self._retry_btn.clicked.connect(self._on_retry)
         self._retry_btn.hide()
         header.addWidget(self._retry_btn)
@@ -114,19 +176,7 @@ class DownloadCard(QFrame):
         self._cancel_btn = QPushButton("✕")
         self._cancel_btn.setFixedSize(28, 28)
         self._cancel_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {Colors.TEXT_MUTED};
-                font-size: 14px;
-                border-radius: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.NEON_RED};
-                color: {Colors.TEXT_PRIMARY};
-            }}
-        """)
+        self._cancel_btn.setStyleSheet(_CANCEL_BTN_QSS)
         self._cancel_btn.clicked.connect(self._on_cancel)
         header.addWidget(self._cancel_btn)
         
@@ -139,41 +189,52 @@ class DownloadCard(QFrame):
         self._progress_bar.setValue(0)
         self._progress_bar.setTextVisible(True)
         self._progress_bar.setFormat("%p%")
-        self._progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {Colors.BG_LIGHT};
-                border: none;
-                border-radius: {Spacing.RADIUS_SM}px;
-                text-align: center;
-                color: {Colors.TEXT_PRIMARY};
-                font-weight: bold;
-                font-size: {Fonts.SIZE_SMALL}px;
-                min-height: 20px;
-            }}
-            QProgressBar::chunk {{
-                background: {Colors.GRADIENT_PRIMARY};
-                border-radius: {Spacing.RADIUS_SM}px;
-            }}
-        """)
+        self._progress_bar.setStyleSheet(_PROGRESS_QSS)
         layout.addWidget(self._progress_bar)
     
     def _setup_animations(self):
         """Setup fade animation for the card."""
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self._opacity_effect.setOpacity(0)
-        self.setGraphicsEffect(self._opacity_effect)
-        
-        self._fade_anim = QPropertyAnimation(self._opacity_effect, b"opacity", self)
-        self._fade_anim.setDuration(300)
-        self._fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        # The opacity effect only exists while fading; a mounted graphics effect
+        # forces the whole card to be composited in software
+        self._fade_anim = self._make_fade_anim(parent=self)
+    
+    def _make_fade_anim(self, parent=None) -> QPropertyAnimation:
+        """Opacity 0 -> 1 animation that drops the effect once it finishes."""
+        anim = QPropertyAnimation(parent)
+        anim.setPropertyName(b"opacity")
+        anim.setDuration(300)
+        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.finished.connect(self._drop_fade_effect)
+        return anim
+    
+    def _install_fade_effect(self) -> QGraphicsOpacityEffect:
+        """Hide the card behind a fresh, fully transparent opacity effect."""
+        effect = QGraphicsOpacityEffect(self)
+        effect.setOpacity(0)
+        self.setGraphicsEffect(effect)
+        return effect
+    
+    def _drop_fade_effect(self):
+        self.setGraphicsEffect(None)
     
     def fade_in(self):
         """Animate card appearance."""
         self._fade_anim.stop()
-        self._fade_anim.setStartValue(0)
-        self._fade_anim.setEndValue(1)
+        self._fade_anim.setTargetObject(self._install_fade_effect())
         self._fade_anim.start()
     
+    def create_fade_in(self) -> QPropertyAnimation:
+        """
+        Hide the card now and return an unstarted, unparented fade-in for it,
+        so a caller can run many cards' fades from one animation group.
+        """
+        self._fade_anim.stop()
+        anim = self._make_fade_anim()
+        anim.setTargetObject(self._install_fade_effect())
+        return anim
+    
     @property
     def chapter_name(self) -> str:
         return self._chapter_name
@@ -182,44 +243,52 @@ class DownloadCard(QFrame):
     def status(self) -> DownloadStatus:
         return self._status
     
+    @pyqtSlot(int)
+    @pyqtSlot(int, int, int)
     def set_progress(self, progress: int, current: int = 0, total: int = 0):
         """Update download progress (0-100) with image counts."""
-        self._progress = max(0, min(100, progress))
-        self._progress_bar.setValue(self._progress)
+        self._progress = max(0, min(100, int(progress)))
+        self._counts = (current, total)
         
-        # Update format to show X / Y images
-        if total > 0:
-            self._progress_bar.setFormat(f"%p% ({current}/{total} images)")
-        else:
-            self._progress_bar.setFormat("%p%")
+        if not self._progress_timer.isActive():
+            self._show_progress()
+            self._progress_timer.start()
         
         if self._status == DownloadStatus.QUEUED and progress > 0:
             self.set_status(DownloadStatus.DOWNLOADING)
     
+    @pyqtSlot()
+    def _show_progress(self):
+        """Push the latest progress to the bar if it changed what is displayed."""
+        self._progress_timer.stop()
+        shown = (self._progress, *self._counts)
+        if shown == self._last_shown:
+            return
+        current, total = self._counts
+        if (current, total) != self._last_shown[1:]:
+            # Update format to show X / Y images
+            if total > 0:
+                self._progress_bar.setFormat(f"%p% ({current}/{total} images)")
+            else:
+                self._progress_bar.setFormat("%p%")
+        self._last_shown = shown
+        self._progress_bar.setValue(self._progress)
+    
     def set_status(self, status: DownloadStatus):
         """Update download status with visual feedback."""
+        previous = self._status
+        changed = status != previous
         self._status = status
+        if status != DownloadStatus.DOWNLOADING:
+            # Settle any throttled update so it can't land after the final value below
+            self._show_progress()
         
-        status_config = {
-            DownloadStatus.QUEUED: ("⏳", "Queued", Colors.TEXT_MUTED),
-            DownloadStatus.DOWNLOADING: ("⬇️", "Downloading...", Colors.NEON_CYAN),
-            DownloadStatus.COMPLETED: ("✅", "Completed", Colors.NEON_GREEN),
-            DownloadStatus.ERROR: ("❌", "Error", Colors.NEON_RED),
-            DownloadStatus.CANCELLED: ("⛔", "Cancelled", Colors.NEON_ORANGE),
-        }
-        
-        icon, text, color = status_config.get(
-            status, ("❓", "Unknown", Colors.TEXT_MUTED)
-        )
-        
-        self._status_icon.setText(icon)
-        self._status_label.setText(text)
-        self._status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: {Fonts.SIZE_SMALL}px;
-            }}
-        """)
+        if changed:
+            # setStyleSheet re-polishes the label even for an identical string
+            icon, text, qss = _STATUS_DISPLAY.get(status, _UNKNOWN_STATUS_DISPLAY)
+            self._status_icon.setText(icon)
+            self._status_label.setText(text)
+            self._status_label.setStyleSheet(qss)
         
         # Show/hide buttons based on status
         if status == DownloadStatus.ERROR:
@@ -233,6 +302,9 @@ class DownloadCard(QFrame):
         else:
             self._cancel_btn.show()
             self._retry_btn.hide()
+        
+        if changed:
+            self.statusChanged.emit(previous, status)
     
     def _on_cancel(self):
         """Handle cancel button click."""
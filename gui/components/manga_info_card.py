@@ -3,20 +3,160 @@ Manga Info Card Component.
 Displays manga cover image, title, and metadata.
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Union
+from functools import lru_cache
+import hashlib
 import os
+import tempfile
 
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
     QScrollArea, QWidget, QGraphicsOpacityEffect, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import (
+    Qt, QPropertyAnimation, QEasingCurve, QSize, QUrl,
+    QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from gui.theme import Colors, Spacing, Fonts
 
 
+# Downloaded covers, keyed by sha1(url); oldest-used files are evicted past the budget
+COVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "weebcentral", "covers")
+COVER_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+
+def _cover_cache_path(url: str) -> str:
+    """Cache file path for a cover URL."""
+    return os.path.join(COVER_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+
+def _store_cover(path: str, data: bytes):
+    """Write a cover into the cache atomically, then trim the cache to budget."""
+    try:
+        os.makedirs(COVER_CACHE_DIR, exist_ok=True)
+        # A unique temp name, so two decodes of the same URL can't clobber each other
+        with tempfile.NamedTemporaryFile(dir=COVER_CACHE_DIR, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            f.write(data)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+        
+        entries = []
+        total = 0
+        with os.scandir(COVER_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total > COVER_CACHE_MAX_BYTES:
+            for _, size, old_path in sorted(entries):
+                if total <= COVER_CACHE_MAX_BYTES * 0.8:
+                    break
+                os.remove(old_path)
+                total -= size
+    except OSError:
+        pass  # The cache is best-effort
+
+
+_COVER_QSS = f"""
+    QLabel {{
+        background-color: transparent;
+        border: 2px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_LG}px;
+    }}
+"""
+
+_META_KEY_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_MUTED};
+        font-size: {Fonts.SIZE_BODY}px;
+        font-weight: bold;
+        min-width: 80px;
+    }}
+"""
+
+_META_VALUE_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_PRIMARY};
+        font-size: {Fonts.SIZE_BODY}px;
+    }}
+"""
+
+
+@lru_cache(maxsize=None)
+def _tag_pill_qss(color: str) -> str:
+    """Stylesheet for a tag pill in the given accent colour."""
+    return f"""
+    QLabel {{
+        background-color: {color}33;
+        color: {color};
+        border: 1px solid {color};
+        border-radius: 10px;
+        padding: 4px 10px;
+        font-size: {Fonts.SIZE_SMALL}px;
+        font-weight: bold;
+    }}
+"""
+
+
+# One manager for every cover so fetches share connections and the DNS cache
+_NAM: Optional[QNetworkAccessManager] = None
+
+
+def _nam() -> QNetworkAccessManager:
+    """Return the shared QNetworkAccessManager, creating it on first use."""
+    global _NAM
+    if _NAM is None:
+        _NAM = QNetworkAccessManager()
+    return _NAM
+
+
+class _DecodeSignals(QObject):
+    """Carries a decoded cover back to the GUI thread."""
+    done = pyqtSignal(int, QImage)  # Request generation, scaled image (null on failure)
+
+
+class _DecodeTask(QRunnable):
+    """Decode and scale a cover on the thread pool; QPixmap stays on the GUI thread."""
+    
+    def __init__(
+        self,
+        source: Union[bytes, str],
+        size: QSize,
+        generation: int,
+        cache_path: Optional[str] = None
+    ):
+        super().__init__()
+        self.signals = _DecodeSignals()
+        self._source = source
+        self._size = size
+        self._generation = generation
+        self._cache_path = cache_path  # Where to keep downloaded bytes that decoded
+    
+    def run(self):
+        image = QImage()
+        if isinstance(self._source, str):
+            image.load(self._source)
+        else:
+            image.loadFromData(self._source)
+        if not image.isNull():
+            image = image.scaled(
+                self._size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+        self.signals.done.emit(self._generation, image)
+        if self._cache_path and not image.isNull():
+            _store_cover(self._cache_path, self._source)
+
+
 class CoverImage(QLabel):
     """
     Cover image display with loading state and shimmer effect.
@@ -29,13 +169,40 @@ class CoverImage(QLabel):
         self.setMaximumSize(220, 310)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         
-        self._network_manager = QNetworkAccessManager(self)
-        self._network_manager.finished.connect(self._on_image_loaded)
+        self._network_manager = _nam()
+        self._pending_reply: Optional[QNetworkReply] = None
+        self._pending_cache_path: Optional[str] = None
+        self._url: Optional[str] = None  # Key for QPixmapCache while a URL cover is shown
+        self._cache_hit_path: Optional[str] = None  # Disk-cache file being decoded, if any
+        # Bumped per load so a slow decode can't overwrite a newer cover
+        self._decode_generation = 0
+        
+        # Resizes rescale from the decoded cover: fast while they keep coming, smooth once settled
+        self._source_pixmap: Optional[QPixmap] = None
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(80)
+        self._smooth_timer.timeout.connect(
+            lambda: self._apply_scaled(Qt.TransformationMode.SmoothTransformation)
+        )
         
         self._set_placeholder()
     
+    def _abort_pending_reply(self):
+        """Abort a cover fetch still in flight; only the latest load may set the cover."""
+        reply = self._pending_reply
+        if reply is not None:
+            # Detach first: abort() emits finished, which must see a stale reply
+            self._pending_reply = None
+            self._pending_cache_path = None
+            reply.abort()
+    
     def _set_placeholder(self):
         """Show placeholder when no image is loaded."""
+        self._abort_pending_reply()
+        self._decode_generation += 1  # Drop any decode still in flight
+        self._source_pixmap = None
+        self._smooth_timer.stop()
         self.setStyleSheet(f"""
             QLabel {{
                 background-color: {Colors.BG_LIGHT};
@@ -53,56 +220,127 @@ class CoverImage(QLabel):
             self._set_placeholder()
             return
         
+        self._abort_pending_reply()
+        self._url = url
+        pixmap = QPixmapCache.find(url)
+        if pixmap is not None:
+            self._decode_generation += 1  # Supersede any decode still running
+            self._set_pixmap(pixmap)
+            return
+        
+        cache_path = _cover_cache_path(url)
+        if os.path.isfile(cache_path):
+            try:
+                os.utime(cache_path)  # Mark as recently used for eviction
+            except OSError:
+                pass
+            self._decode_async(cache_path)
+            self._cache_hit_path = cache_path
+            return
+        
+        self._fetch(url, cache_path)
+    
+    def _fetch(self, url: str, cache_path: str):
+        """Download a cover; it is decoded (and cached) once the reply finishes."""
         self.setText("⏳")
-        request = QNetworkRequest(url)
-        self._network_manager.get(request)
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        
+        reply = self._network_manager.get(request)
+        reply.setParent(self)  # Dies with the widget instead of calling back into it
+        self._pending_reply = reply
+        self._pending_cache_path = cache_path
+        reply.finished.connect(lambda: self._on_image_loaded(reply))
     
     def load_from_file(self, path: str):
-        """Load cover image from local file."""
+        """Load cover image from local file (decoded off the GUI thread)."""
+        self._abort_pending_reply()
+        self._url = None
         if os.path.exists(path):
-            pixmap = QPixmap(path)
-            self._set_pixmap(pixmap)
+            self._decode_async(path)
         else:
             self._set_placeholder()
     
-    def load_from_bytes(self, data: bytes):
-        """Load cover image from bytes."""
-        image = QImage()
-        if image.loadFromData(data):
-            pixmap = QPixmap.fromImage(image)
-            self._set_pixmap(pixmap)
-        else:
+    def load_from_bytes(self, data: bytes, url: Optional[str] = None):
+        """
+        Load cover image from bytes (decoded off the GUI thread).
+        With the cover's URL, a cover already decoded this session is reused.
+        """
+        self._abort_pending_reply()
+        self._url = url or None
+        if self._url:
+            pixmap = QPixmapCache.find(self._url)
+            if pixmap is not None:
+                self._decode_generation += 1  # Supersede any decode still running
+                self._set_pixmap(pixmap)
+                return
+        self._decode_async(bytes(data))
+    
+    def _decode_async(self, source: Union[bytes, str], cache_path: Optional[str] = None):
+        """Decode on the global thread pool and apply the result when done."""
+        self._decode_generation += 1
+        self._cache_hit_path = None
+        # Decode at the largest size the label allows so resizes never upscale
+        task = _DecodeTask(source, self.maximumSize(), self._decode_generation, cache_path)
+        task.signals.done.connect(self._on_image_decoded)
+        QThreadPool.globalInstance().start(task)
+    
+    @pyqtSlot(int, QImage)
+    def _on_image_decoded(self, generation: int, image: QImage):
+        """Apply a decoded cover unless a newer load has started since."""
+        if generation != self._decode_generation:
+            return
+        if image.isNull():
+            cache_path, self._cache_hit_path = self._cache_hit_path, None
+            if cache_path and self._url:
+                # Corrupt cache file: drop it and fetch the cover again
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+                self._fetch(self._url, cache_path)
+                return
             self._set_placeholder()
+        else:
+            self._set_pixmap(QPixmap.fromImage(image))
     
+    @pyqtSlot(QNetworkReply)
     def _on_image_loaded(self, reply: QNetworkReply):
         """Handle network image load complete."""
+        if reply is not self._pending_reply:
+            reply.deleteLater()
+            return
+        self._pending_reply = None
         if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            image = QImage()
-            if image.loadFromData(data):
-                pixmap = QPixmap.fromImage(image)
-                self._set_pixmap(pixmap)
-            else:
-                self._set_placeholder()
+            self._decode_async(bytes(reply.readAll()), self._pending_cache_path)
         else:
             self._set_placeholder()
         reply.deleteLater()
     
     def _set_pixmap(self, pixmap: QPixmap):
         """Set the pixmap with proper scaling and styling."""
-        scaled = pixmap.scaled(
+        self._source_pixmap = pixmap
+        self._smooth_timer.stop()
+        if self._url:
+            QPixmapCache.insert(self._url, pixmap)
+        self._apply_scaled(Qt.TransformationMode.SmoothTransformation)
+        self.setStyleSheet(_COVER_QSS)
+    
+    def _apply_scaled(self, mode: Qt.TransformationMode):
+        """Show the source cover scaled to the current size."""
+        if self._source_pixmap is None:
+            return
+        self.setPixmap(self._source_pixmap.scaled(
             self.size(),
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.setPixmap(scaled)
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: transparent;
-                border: 2px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_LG}px;
-            }}
-        """)
+            mode
+        ))
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._source_pixmap is not None:
+            self._apply_scaled(Qt.TransformationMode.FastTransformation)
+            self._smooth_timer.start()
 
 
 class TagPill(QLabel):
@@ -110,17 +348,7 @@ class TagPill(QLabel):
     
     def __init__(self, text: str, color: str = Colors.NEON_CYAN, parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color}33;
-                color: {color};
-                border: 1px solid {color};
-                border-radius: 10px;
-                padding: 4px 10px;
-                font-size: {Fonts.SIZE_SMALL}px;
-                font-weight: bold;
-            }}
-        """)
+        self.setStyleSheet(_tag_pill_qss(color))
 
 
 class MangaInfoCard(QFrame):
@@ -131,6 +359,9 @@ class MangaInfoCard(QFrame):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Metadata rows and tag pills are reused across manga; surplus ones are hidden
+        self._row_pool: List[Tuple[QWidget, QLabel, QLabel]] = []
+        self._pill_pool: List[TagPill] = []
         self._setup_ui()
         self._setup_animations()
     
@@ -232,49 +463,33 @@ class MangaInfoCard(QFrame):
         
         # Load cover
         if cover_bytes:
-            self._cover.load_from_bytes(cover_bytes)
+            self._cover.load_from_bytes(cover_bytes, cover_url)
         elif cover_path:
             self._cover.load_from_file(cover_path)
         elif cover_url:
             self._cover.load_from_url(cover_url)
         
-        # Clear and set metadata
-        self._clear_layout(self._metadata_layout)
-        if metadata:
-            for key, value in metadata.items():
-                row = QHBoxLayout()
-                row.setSpacing(Spacing.MD)
-                
-                key_label = QLabel(f"{key}:")
-                key_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {Colors.TEXT_MUTED};
-                        font-size: {Fonts.SIZE_BODY}px;
-                        font-weight: bold;
-                        min-width: 80px;
-                    }}
-                """)
-                row.addWidget(key_label)
-                
-                value_label = QLabel(str(value))
-                value_label.setWordWrap(True)
-                value_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {Colors.TEXT_PRIMARY};
-                        font-size: {Fonts.SIZE_BODY}px;
-                    }}
-                """)
-                row.addWidget(value_label, 1)
-                
-                self._metadata_layout.addLayout(row)
+        # Fill metadata rows, reusing pooled widgets
+        items = list(metadata.items()) if metadata else []
+        while len(self._row_pool) < len(items):
+            self._row_pool.append(self._create_metadata_row())
+        for i, (row, key_label, value_label) in enumerate(self._row_pool):
+            if i < len(items):
+                key, value = items[i]
+                key_label.setText(f"{key}:")
+                value_label.setText(str(value))
+            row.setVisible(i < len(items))
         
-        # Clear and set tags
-        self._clear_layout(self._tags_layout)
-        if tags:
-            for tag in tags[:8]:  # Limit to 8 tags
-                pill = TagPill(tag)
-                self._tags_layout.insertWidget(self._tags_layout.count() - 1, pill)
-        self._tags_layout.addStretch()
+        # Fill tag pills the same way
+        tags = tags[:8] if tags else []  # Limit to 8 tags
+        while len(self._pill_pool) < len(tags):
+            pill = TagPill("")
+            self._tags_layout.insertWidget(self._tags_layout.count() - 1, pill)
+            self._pill_pool.append(pill)
+        for i, pill in enumerate(self._pill_pool):
+            if i < len(tags):
+                pill.setText(tags[i])
+            pill.setVisible(i < len(tags))
         
         # Set description
         self._description.setText(description[:500] + "..." if len(description) > 500 else description)
@@ -286,15 +501,26 @@ class MangaInfoCard(QFrame):
         self._title.setText("No manga loaded")
         self._cover._set_placeholder()
         self._description.setText("")
-        self._clear_layout(self._metadata_layout)
-        self._clear_layout(self._tags_layout)
-        self._tags_layout.addStretch()
+        for row, _, _ in self._row_pool:
+            row.hide()
+        for pill in self._pill_pool:
+            pill.hide()
     
-    def _clear_layout(self, layout):
-        """Remove all items from a layout."""
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                self._clear_layout(item.layout())
+    def _create_metadata_row(self) -> Tuple[QWidget, QLabel, QLabel]:
+        """Create one pooled key/value metadata row."""
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(Spacing.MD)
+        
+        key_label = QLabel()
+        key_label.setStyleSheet(_META_KEY_QSS)
+        row_layout.addWidget(key_label)
+        
+        value_label = QLabel()
+        value_label.setWordWrap(True)
+        value_label.setStyleSheet(_META_VALUE_QSS)
+        row_layout.addWidget(value_label, 1)
+        
+        self._metadata_layout.addWidget(row)
+        return row, key_label, value_label
@@ -3,11 +3,25 @@ Settings Manager with JSON persistence.
 Handles all application configuration with save/load functionality.
 """
 
-import json
 import os
-from dataclasses import dataclass, field, asdict
+import threading
+from dataclasses import dataclass, field, fields
 from typing import List, Optional
 
+# Optional C-accelerated JSON; both paths work on bytes
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # Default settings file location
 SETTINGS_FILE = os.path.join(
@@ -16,6 +30,9 @@ SETTINGS_FILE = os.path.join(
 )
 
 
+_UNSET = object()
+
+
 @dataclass
 class Settings:
     """Application settings with defaults."""
@@ -43,12 +60,30 @@ class Settings:
     # Recent URLs (max 10)
     recent_urls: List[str] = field(default_factory=list)
     
+    def __setattr__(self, name: str, value):
+        # Only declared fields, like __slots__ would enforce (slots=True needs 3.10)
+        if name != "_dirty" and name not in _SETTINGS_FIELD_SET:
+            raise AttributeError(f"Unknown setting: {name}")
+        # Track unsaved changes so save() can skip rewriting an unchanged file
+        if name != "_dirty" and getattr(self, name, _UNSET) != value:
+            object.__setattr__(self, "_dirty", True)
+        object.__setattr__(self, name, value)
+    
+    def to_dict(self) -> dict:
+        """Plain dict of all fields for JSON; a shallow stand-in for asdict()."""
+        return {name: getattr(self, name) for name in _SETTINGS_FIELDS}
+    
     def add_recent_url(self, url: str):
         """Add URL to recent list, keeping max 10."""
-        if url in self.recent_urls:
-            self.recent_urls.remove(url)
-        self.recent_urls.insert(0, url)
-        self.recent_urls = self.recent_urls[:10]
+        # dict.fromkeys keeps first occurrences in order: url moves to the front
+        # and any duplicates (e.g. from a hand-edited file) collapse in one pass.
+        # A new list is assigned so the change is tracked.
+        self.recent_urls = list(dict.fromkeys([url, *self.recent_urls]))[:10]
+
+
+# Field names in declaration order, for (de)serialization
+_SETTINGS_FIELDS = tuple(f.name for f in fields(Settings))
+_SETTINGS_FIELD_SET = frozenset(_SETTINGS_FIELDS)
 
 
 class SettingsManager:
@@ -56,11 +91,16 @@ class SettingsManager:
     
     _instance: Optional['SettingsManager'] = None
     _settings: Optional[Settings] = None
+    # Workers can reach settings too: guards first construction and file writes
+    _lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._settings = cls._instance._load()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._settings = instance._load()
+                    cls._instance = instance  # Publish only once fully loaded
         return cls._instance
     
     @property
@@ -72,24 +112,42 @@ class SettingsManager:
         """Load settings from JSON file."""
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Create Settings with loaded data, using defaults for missing keys
-                    return Settings(**{
-                        k: v for k, v in data.items() 
-                        if k in Settings.__dataclass_fields__
-                    })
-            except (json.JSONDecodeError, TypeError) as e:
+                # One read, then parse; json.load would go through the text layer
+                with open(SETTINGS_FILE, "rb") as f:
+                    data = _loads(f.read())
+                # Create Settings with loaded data, using defaults for missing keys
+                settings = Settings(**{
+                    k: v for k, v in data.items() 
+                    if k in _SETTINGS_FIELD_SET
+                })
+                settings._dirty = False  # Matches what is on disk
+                return settings
+            except (ValueError, TypeError) as e:  # ValueError covers JSON and UTF-8 errors
                 print(f"Error loading settings: {e}")
         return Settings()
     
-    def save(self):
-        """Save current settings to JSON file."""
+    def save(self) -> bool:
+        """
+        Save current settings to JSON file, if anything changed since the last save.
+        Returns True if the file was written.
+        """
+        if not self._settings._dirty:
+            return False
+        # Serialize first and write once
+        settings = self._settings
+        data = _dumps(settings.to_dict())
+        tmp_path = f"{SETTINGS_FILE}.tmp"
         try:
-            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(asdict(self._settings), f, indent=2)
+            with self._lock:
+                # Write aside and swap in, so a crash mid-write can't truncate the file
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, SETTINGS_FILE)
+                settings._dirty = False
+            return True
         except IOError as e:
             print(f"Error saving settings: {e}")
+            return False
     
     def reset(self):
         """Reset settings to defaults."""
@@ -101,8 +159,8 @@ class SettingsManager:
         return getattr(self._settings, key, default)
     
     def set(self, key: str, value):
-        """Set a setting value by key."""
-        if hasattr(self._settings, key):
+        """Set a setting value by key; unknown keys are ignored."""
+        if key in _SETTINGS_FIELD_SET:
             setattr(self._settings, key, value)
 
 
@@ -112,9 +170,9 @@ def get_settings() -> Settings:
     return SettingsManager().settings
 
 
-def save_settings():
-    """Save current settings to file."""
-    SettingsManager().save()
+def save_settings() -> bool:
+    """Save current settings to file; False if nothing changed or the write failed."""
+    return SettingsManager().save()
 
 
 def reset_settings():
@@ -3,6 +3,8 @@ Main Window for WeebCentral Downloader.
 Tabbed interface with sidebar navigation and animated transitions.
 """
 
+from typing import Dict, Optional
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QStackedWidget, QFrame, QLabel, QButtonGroup, QMessageBox
@@ -12,10 +14,50 @@ from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from gui.theme import Colors, Spacing, Fonts
 from gui.config import get_settings, save_settings
 from gui.components.animated_button import NavButton
-from gui.tabs import UrlInputTab, MangaInfoTab, DownloadsTab, SettingsTab, LibraryTab
+from gui.tabs import UrlInputTab
 from gui.workers import ScraperWorker, DownloadWorker, ConversionWorker
 from gui.components.download_card import DownloadStatus
-from flaresolverr_client import is_flaresolverr_running
+
+
+_SIDEBAR_QSS = f"""
+    QFrame {{
+        background-color: {Colors.BG_DARK};
+        border-right: 1px solid {Colors.BORDER_DEFAULT};
+    }}
+"""
+
+_TITLE_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_PRIMARY};
+        font-family: {Fonts.FAMILY_DISPLAY};
+        font-size: {Fonts.SIZE_H2}px;
+        font-weight: bold;
+        padding: {Spacing.MD}px;
+    }}
+"""
+
+_SUBTITLE_QSS = f"""
+    QLabel {{
+        color: {Colors.NEON_CYAN};
+        font-size: {Fonts.SIZE_SMALL}px;
+        padding-left: {Spacing.MD}px;
+        margin-bottom: {Spacing.LG}px;
+    }}
+"""
+
+_VERSION_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_MUTED};
+        font-size: {Fonts.SIZE_TINY}px;
+        padding: {Spacing.SM}px;
+    }}
+"""
+
+_STACK_QSS = f"""
+    QStackedWidget {{
+        background-color: {Colors.BG_DARKEST};
+    }}
+"""
 
 
 class MainWindow(QMainWindow):
@@ -32,6 +74,8 @@ class MainWindow(QMainWindow):
         self._conversion_worker = None
         self._current_manga_url = ""
         self._cover_data = None
+        self._manga_info: Optional[dict] = None
+        self._chapters: list = []
         
         self._setup_window()
         self._setup_ui()
@@ -67,12 +111,7 @@ class MainWindow(QMainWindow):
         # ─────────────────────────────────────────────────────────────
         sidebar = QFrame()
         sidebar.setFixedWidth(220)
-        sidebar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_DARK};
-                border-right: 1px solid {Colors.BORDER_DEFAULT};
-            }}
-        """)
+        sidebar.setStyleSheet(_SIDEBAR_QSS)
         
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setContentsMargins(Spacing.MD, Spacing.LG, Spacing.MD, Spacing.LG)
@@ -80,26 +119,11 @@ class MainWindow(QMainWindow):
         
         # App title
         title = QLabel("WeebCentral")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-family: {Fonts.FAMILY_DISPLAY};
-                font-size: {Fonts.SIZE_H2}px;
-                font-weight: bold;
-                padding: {Spacing.MD}px;
-            }}
-        """)
+        title.setStyleSheet(_TITLE_QSS)
         sidebar_layout.addWidget(title)
         
         subtitle = QLabel("Manga Downloader")
-        subtitle.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.NEON_CYAN};
-                font-size: {Fonts.SIZE_SMALL}px;
-                padding-left: {Spacing.MD}px;
-                margin-bottom: {Spacing.LG}px;
-            }}
-        """)
+        subtitle.setStyleSheet(_SUBTITLE_QSS)
         sidebar_layout.addWidget(subtitle)
         
         # Navigation buttons
@@ -131,13 +155,7 @@ class MainWindow(QMainWindow):
         
         # Version info
         version = QLabel("v2.0.0")
-        version.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: {Fonts.SIZE_TINY}px;
-                padding: {Spacing.SM}px;
-            }}
-        """)
+        version.setStyleSheet(_VERSION_QSS)
         sidebar_layout.addWidget(version)
         
         main_layout.addWidget(sidebar)
@@ -146,24 +164,16 @@ class MainWindow(QMainWindow):
         # Content Area (Stacked Pages)
         # ─────────────────────────────────────────────────────────────
         self._stack = QStackedWidget()
-        self._stack.setStyleSheet(f"""
-            QStackedWidget {{
-                background-color: {Colors.BG_DARKEST};
-            }}
-        """)
+        self._stack.setStyleSheet(_STACK_QSS)
         
-        # Create tabs
+        # Create tabs - only the URL tab is visible at startup; the others
+        # sit behind placeholder pages until first shown or used
         self._url_tab = UrlInputTab()
-        self._info_tab = MangaInfoTab()
-        self._downloads_tab = DownloadsTab()
-        self._library_tab = LibraryTab()
-        self._settings_tab = SettingsTab()
+        self._tabs: Dict[int, QWidget] = {0: self._url_tab}
         
         self._stack.addWidget(self._url_tab)
-        self._stack.addWidget(self._info_tab)
-        self._stack.addWidget(self._downloads_tab)
-        self._stack.addWidget(self._library_tab)
-        self._stack.addWidget(self._settings_tab)
+        for _ in range(4):
+            self._stack.addWidget(QWidget())
         
         main_layout.addWidget(self._stack, 1)
     
@@ -172,39 +182,86 @@ class MainWindow(QMainWindow):
         # Navigation
         self._nav_group.idClicked.connect(self._on_nav_clicked)
         
-        # URL Tab
+        # URL Tab (the other tabs are wired in _build_tab)
         self._url_tab.fetchRequested.connect(self._on_fetch_requested)
-        
-        # Manga Info Tab
-        self._info_tab.downloadRequested.connect(self._on_download_requested)
-        
-        # Downloads Tab
-        self._downloads_tab.cancelDownload.connect(self._on_cancel_download)
-        self._downloads_tab.retryChapter.connect(self._on_retry_chapter)
-        self._downloads_tab.retryAllFailed.connect(self._on_retry_all_failed)
-        
-        # Library Tab
-        self._library_tab.downloadMissingChapters.connect(self._on_download_missing_chapters)
-        self._library_tab.convertToPDF.connect(self._on_convert_to_pdf)
-        self._library_tab.convertToEPUB.connect(self._on_convert_to_epub)
-        self._library_tab.convertToCBZ.connect(self._on_convert_to_cbz)
-        
-        # Settings Tab
-        self._settings_tab.settingsChanged.connect(self._on_settings_changed)
+    
+    def _build_tab(self, index: int) -> QWidget:
+        """Create the tab for a stack index and connect its signals."""
+        if index == 1:
+            from gui.tabs import MangaInfoTab
+            tab = MangaInfoTab()
+            tab.downloadRequested.connect(self._on_download_requested)
+        elif index == 2:
+            from gui.tabs import DownloadsTab
+            tab = DownloadsTab()
+            tab.cancelDownload.connect(self._on_cancel_download)
+            tab.retryChapter.connect(self._on_retry_chapter)
+            tab.retryAllFailed.connect(self._on_retry_all_failed)
+        elif index == 3:
+            from gui.tabs import LibraryTab
+            tab = LibraryTab()
+            tab.downloadMissingChapters.connect(self._on_download_missing_chapters)
+            tab.convertToPDF.connect(self._on_convert_to_pdf)
+            tab.convertToEPUB.connect(self._on_convert_to_epub)
+            tab.convertToCBZ.connect(self._on_convert_to_cbz)
+        else:
+            from gui.tabs import SettingsTab
+            tab = SettingsTab()
+            tab.settingsChanged.connect(self._on_settings_changed)
+        return tab
+    
+    def _ensure_tab(self, index: int) -> bool:
+        """Build a lazily created tab in place of its placeholder. Returns True if built now."""
+        if index in self._tabs or not 0 <= index < self._stack.count():
+            return False
+        tab = self._build_tab(index)
+        self._tabs[index] = tab
+        self._replace_page(index, tab)
+        return True
+    
+    def _tab(self, index: int) -> QWidget:
+        """Get a tab, building it first if needed."""
+        self._ensure_tab(index)
+        return self._tabs[index]
+    
+    @property
+    def _info_tab(self):
+        return self._tab(1)
+    
+    @property
+    def _downloads_tab(self):
+        return self._tab(2)
+    
+    @property
+    def _library_tab(self):
+        return self._tab(3)
+    
+    @property
+    def _settings_tab(self):
+        return self._tab(4)
+    
+    def _replace_page(self, index: int, page: QWidget):
+        """Swap the stack page at index for another widget."""
+        placeholder = self._stack.widget(index)
+        self._stack.insertWidget(index, page)
+        self._stack.removeWidget(placeholder)
+        placeholder.deleteLater()
     
     def _on_nav_clicked(self, index: int):
         """Handle navigation button click."""
+        self._ensure_tab(index)
         self._stack.setCurrentIndex(index)
     
     def _switch_to_tab(self, index: int):
         """Switch to a specific tab programmatically."""
+        created = self._ensure_tab(index)
         self._stack.setCurrentIndex(index)
         buttons = [self._nav_url, self._nav_info, self._nav_downloads, self._nav_library, self._nav_settings]
         if 0 <= index < len(buttons):
             buttons[index].setChecked(True)
         
-        # Refresh library when switching to it
-        if index == 3:  # Library tab
+        # Refresh library when switching to it (a new one has just scanned)
+        if index == 3 and not created:  # Library tab
             self._library_tab.refresh()
     
     # ═════════════════════════════════════════════════════════════════
@@ -215,6 +272,8 @@ class MainWindow(QMainWindow):
         """Handle manga URL fetch request."""
         self._current_manga_url = url
         self._cover_data = None
+        self._manga_info = None
+        self._chapters = []
         
         # Create and start scraper worker
         self._scraper_worker = ScraperWorker()
@@ -252,7 +311,7 @@ class MainWindow(QMainWindow):
     
     def _on_scraper_finished(self, success: bool):
         """Handle scraper completion."""
-        if success and hasattr(self, '_manga_info'):
+        if success and self._manga_info is not None:
             # Update manga info tab
             self._info_tab.set_manga_info(
                 url=self._current_manga_url,
@@ -262,7 +321,7 @@ class MainWindow(QMainWindow):
                 description=self._manga_info.get("description", ""),
                 metadata=self._manga_info.get("metadata", {}),
                 tags=self._manga_info.get("tags", []),
-                chapters=getattr(self, '_chapters', [])
+                chapters=self._chapters
             )
             
             self._url_tab.show_success("Manga info loaded!")
@@ -294,8 +353,7 @@ class MainWindow(QMainWindow):
         ]
         
         # Add download cards
-        for ch in chapters:
-            self._downloads_tab.add_download(ch.name)
+        self._downloads_tab.add_downloads([ch.name for ch in chapters])
         
         # Switch to downloads tab
         self._switch_to_tab(2)
@@ -305,7 +363,7 @@ class MainWindow(QMainWindow):
         self._download_worker.set_download_params(
             manga_url=self._current_manga_url,
             chapters=chapter_dicts,
-            manga_title=self._manga_info.get("title", "Unknown"),
+            manga_title=(self._manga_info or {}).get("title", "Unknown"),
             manga_info=self._manga_info,
             cover_data=self._cover_data
         )
@@ -475,9 +533,9 @@ class MainWindow(QMainWindow):
             return
         
         # Add conversion cards to downloads tab in correct order
-        for chapter_dir in chapter_dirs:
-            chapter_name = f"{chapter_dir.name} ({type_name})"
-            self._downloads_tab.add_download(chapter_name)
+        self._downloads_tab.add_downloads([
+            f"{chapter_dir.name} ({type_name})" for chapter_dir in chapter_dirs
+        ])
         
         # Switch to downloads tab
         self._switch_to_tab(2)
@@ -551,8 +609,9 @@ class MainWindow(QMainWindow):
     
     def _on_settings_changed(self):
         """Handle settings change."""
-        # Settings are auto-saved, nothing special needed here
-        pass
+        # Settings are auto-saved; only cached paths need dropping
+        if 2 in self._tabs:  # Don't build the Downloads tab just for this
+            self._downloads_tab.invalidate_path_cache()
     
     # ═════════════════════════════════════════════════════════════════
     # Window Events
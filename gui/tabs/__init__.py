@@ -1,12 +1,17 @@
 """
 Tab views for WeebCentral Downloader.
+Tabs are imported on first access, so importing this package stays cheap.
 """
 
-from gui.tabs.url_input_tab import UrlInputTab
-from gui.tabs.manga_info_tab import MangaInfoTab
-from gui.tabs.downloads_tab import DownloadsTab
-from gui.tabs.settings_tab import SettingsTab
-from gui.tabs.library_tab import LibraryTab
+import importlib
+
+_TAB_MODULES = {
+    "UrlInputTab": "gui.tabs.url_input_tab",
+    "MangaInfoTab": "gui.tabs.manga_info_tab",
+    "DownloadsTab": "gui.tabs.downloads_tab",
+    "SettingsTab": "gui.tabs.settings_tab",
+    "LibraryTab": "gui.tabs.library_tab",
+}
 
 __all__ = [
     "UrlInputTab",
@@ -15,3 +20,16 @@ __all__ = [
     "SettingsTab",
     "LibraryTab",
 ]
+
+
+def __getattr__(name):
+    module = _TAB_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tab_class = getattr(importlib.import_module(module), name)
+    globals()[name] = tab_class  # Later lookups skip __getattr__
+    return tab_class
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
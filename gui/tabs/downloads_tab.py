@@ -3,21 +3,34 @@ Downloads Tab.
 Shows active and completed downloads with progress tracking.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
+from collections import Counter
 import os
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QFrame, QScrollArea, QPushButton, QProgressBar, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QAbstractAnimation
 from PyQt6.QtGui import QCursor, QDesktopServices
 from PyQt6.QtCore import QUrl
 
-from gui.theme import Colors, Spacing, Fonts
+from gui.theme import Spacing
 from gui.components.animated_button import AnimatedButton
 from gui.components.download_card import DownloadCard, DownloadStatus
 from gui.config import get_settings
+from gui.animations import stagger_animations
+
+
+# Past this many cards, new ones appear without the fade-in
+FADE_IN_CARD_LIMIT = 20
+# Delay between consecutive cards' fade-ins within one batch
+FADE_IN_STAGGER_MS = 20
+
+# Cards that "Clear Completed" removes
+_FINISHED_STATUSES = frozenset({
+    DownloadStatus.COMPLETED, DownloadStatus.ERROR, DownloadStatus.CANCELLED
+})
 
 
 class DownloadsTab(QWidget):
@@ -32,6 +45,26 @@ class DownloadsTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._cards: Dict[str, DownloadCard] = {}
+        self._card_order: List[DownloadCard] = []  # Cards in layout order
+        # Cards per status, kept in step with the cards' statusChanged signals
+        self._status_counts: Counter = Counter()
+        # Each card's share of the overall bar (0-100, completed = 100) and their sum
+        self._card_progress: Dict[str, int] = {}
+        self._progress_sum = 0
+        # (active, failed, completed) the status label and retry button currently show
+        self._shown_status: Tuple[int, int, int] = (0, 0, 0)
+        
+        # Latest (progress, current, total) per chapter, applied to the cards ~30 times a second
+        self._pending_progress: Dict[str, Tuple[int, int, int]] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Absolute download folder already known to exist, and the output_dir it came from
+        self._resolved_output_path: Optional[str] = None
+        self._resolved_for: Optional[str] = None
+        
         self._sort_by = "name"  # 'name' or 'progress'
         self._sort_order = "asc"  # 'asc' or 'desc'
         self._setup_ui()
@@ -44,14 +77,7 @@ class DownloadsTab(QWidget):
         
         # Header with overall progress
         header = QFrame()
-        header.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_MEDIUM};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_LG}px;
-                padding: {Spacing.LG}px;
-            }}
-        """)
+        header.setObjectName("downloads-header")  # Styled in gui/theme.py
         header_layout = QVBoxLayout(header)
         header_layout.setSpacing(Spacing.MD)
         
@@ -59,26 +85,14 @@ class DownloadsTab(QWidget):
         title_row = QHBoxLayout()
         
         title = QLabel("⬇️ Downloads")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-family: {Fonts.FAMILY_DISPLAY};
-                font-size: {Fonts.SIZE_H2}px;
-                font-weight: bold;
-            }}
-        """)
+        title.setObjectName("downloads-title")
         title_row.addWidget(title)
         
         title_row.addStretch()
         
         # Status label
         self._status_label = QLabel("No active downloads")
-        self._status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        self._status_label.setObjectName("downloads-status")
         title_row.addWidget(self._status_label)
         
         header_layout.addLayout(title_row)
@@ -90,21 +104,7 @@ class DownloadsTab(QWidget):
         self._overall_progress.setValue(0)
         self._overall_progress.setTextVisible(True)
         self._overall_progress.setFormat("Overall: %p%")
-        self._overall_progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {Colors.BG_LIGHT};
-                border: none;
-                border-radius: {Spacing.RADIUS_SM}px;
-                text-align: center;
-                color: {Colors.TEXT_PRIMARY};
-                font-weight: bold;
-                min-height: 24px;
-            }}
-            QProgressBar::chunk {{
-                background: {Colors.GRADIENT_SUCCESS};
-                border-radius: {Spacing.RADIUS_SM}px;
-            }}
-        """)
+        self._overall_progress.setObjectName("downloads-overall")
         header_layout.addWidget(self._overall_progress)
         
         # Action buttons
@@ -128,47 +128,12 @@ class DownloadsTab(QWidget):
         
         # Sort controls
         sort_label = QLabel("Sort by:")
-        sort_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: {Fonts.SIZE_SMALL}px;
-            }}
-        """)
+        sort_label.setObjectName("downloads-sort-label")
         btn_row.addWidget(sort_label)
         
         self._sort_combo = QComboBox()
         self._sort_combo.addItems(["Name ↑", "Name ↓", "Progress ↑", "Progress ↓"])
-        self._sort_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {Colors.BG_LIGHT};
-                color: {Colors.TEXT_PRIMARY};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_SM}px;
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                font-size: {Fonts.SIZE_SMALL}px;
-                min-width: 120px;
-            }}
-            QComboBox:hover {{
-                border-color: {Colors.NEON_CYAN};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid {Colors.TEXT_SECONDARY};
-                margin-right: 8px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {Colors.BG_MEDIUM};
-                color: {Colors.TEXT_PRIMARY};
-                selection-background-color: {Colors.NEON_CYAN};
-                selection-color: {Colors.BG_DARK};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-            }}
-        """)
+        self._sort_combo.setObjectName("downloads-sort")
         self._sort_combo.currentIndexChanged.connect(self._on_sort_changed)
         btn_row.addWidget(self._sort_combo)
         
@@ -180,12 +145,7 @@ class DownloadsTab(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+        scroll.setObjectName("downloads-scroll")
         
         self._scroll_content = QWidget()
         self._scroll_layout = QVBoxLayout(self._scroll_content)
@@ -200,17 +160,12 @@ class DownloadsTab(QWidget):
         
         empty_icon = QLabel("📥")
         empty_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_icon.setStyleSheet("font-size: 48px;")
+        empty_icon.setObjectName("downloads-empty-icon")
         empty_layout.addWidget(empty_icon)
         
         empty_text = QLabel("No downloads yet")
         empty_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_text.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        empty_text.setObjectName("downloads-empty-text")
         empty_layout.addWidget(empty_text)
         
         self._scroll_layout.addWidget(self._empty_widget)
@@ -236,68 +191,114 @@ class DownloadsTab(QWidget):
         if not self._cards:
             return
         
-        # Get all cards with their data
-        card_data = []
-        for name, card in self._cards.items():
-            card_data.append({
-                'name': name,
-                'card': card,
-                'progress': card._progress
-            })
-        
         # Sort based on current settings
+        reverse = self._sort_order == "desc"
         if self._sort_by == "name":
-            card_data.sort(key=lambda x: x['name'].lower(), reverse=(self._sort_order == "desc"))
+            ordered = sorted(self._cards.items(), key=lambda item: item[0].lower(), reverse=reverse)
         else:  # progress
-            card_data.sort(key=lambda x: x['progress'], reverse=(self._sort_order == "desc"))
+            ordered = sorted(self._cards.items(), key=lambda item: item[1]._progress, reverse=reverse)
+        cards = [card for _, card in ordered]
+        
+        # Progress ticks mostly leave the order alone; don't relayout for nothing
+        if cards == self._card_order:
+            return
+        self._card_order = cards
         
         # Remove all cards from layout
-        for data in card_data:
-            self._scroll_layout.removeWidget(data['card'])
+        for card in cards:
+            self._scroll_layout.removeWidget(card)
         
         # Re-add in sorted order
-        for data in card_data:
-            self._scroll_layout.addWidget(data['card'])
+        for card in cards:
+            self._scroll_layout.addWidget(card)
     
     def add_download(self, chapter_name: str) -> DownloadCard:
         """Add a new download card."""
-        if chapter_name in self._cards:
-            return self._cards[chapter_name]
+        return self.add_downloads([chapter_name])[0]
+    
+    def add_downloads(self, chapter_names: List[str]) -> List[DownloadCard]:
+        """Add download cards for several chapters, laying the list out once."""
+        cards = []
+        new_cards = []
+        for chapter_name in chapter_names:
+            card = self._cards.get(chapter_name)
+            if card is None:
+                card = self._create_card(chapter_name)
+                new_cards.append(card)
+            cards.append(card)
+        
+        if not new_cards:
+            return cards
         
         # Hide empty state
         self._empty_widget.hide()
         
-        # Create new card
+        # Add cards in sorted position
+        self._scroll_content.setUpdatesEnabled(False)
+        try:
+            self._resort_cards()
+        finally:
+            self._scroll_content.setUpdatesEnabled(True)
+        self._update_status()
+        
+        # Fade in new cards, but not when a whole batch is being queued at once
+        if len(self._cards) <= FADE_IN_CARD_LIMIT:
+            if len(new_cards) == 1:
+                new_cards[0].fade_in()
+            else:
+                # One group drives the whole batch, each card a little after the last
+                group = stagger_animations(
+                    [card.create_fade_in() for card in new_cards], FADE_IN_STAGGER_MS
+                )
+                group.setParent(self)
+                group.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        
+        return cards
+    
+    def _create_card(self, chapter_name: str) -> DownloadCard:
+        """Create and register a card; the caller places it in the layout."""
         card = DownloadCard(chapter_name)
         card.cancelRequested.connect(self._on_cancel_requested)
         card.retryRequested.connect(lambda name=chapter_name: self.retryChapter.emit(name))
+        card.statusChanged.connect(
+            lambda old, new, name=chapter_name: self._on_card_status_changed(name, old, new)
+        )
         
         self._cards[chapter_name] = card
-        
-        # Add card in sorted position
-        self._resort_cards()
-        
-        # Trigger fade-in animation (fix visibility)
-        card.fade_in()
-        
+        self._status_counts[card.status] += 1
+        self._card_progress[chapter_name] = 0
         return card
     
     def update_progress(self, chapter_name: str, progress: int, current: int = 0, total: int = 0):
         """Update download progress for a chapter."""
         if chapter_name in self._cards:
-            card = self._cards[chapter_name]
-            card.set_progress(progress, current, total)
-            self._update_overall_progress()
-            # Re-sort if sorting by progress
-            if self._sort_by == "progress":
-                self._resort_cards()
+            self._pending_progress[chapter_name] = (progress, current, total)
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply buffered progress to the cards, then refresh totals and order once."""
+        self._progress_timer.stop()
+        if not self._pending_progress:
+            return
+        pending, self._pending_progress = self._pending_progress, {}
+        for chapter_name, (progress, current, total) in pending.items():
+            card = self._cards.get(chapter_name)
+            if card is not None:
+                card.set_progress(progress, current, total)
+                self._set_card_progress(chapter_name, card)
+        self._update_overall_progress()
+        # Re-sort if sorting by progress
+        if self._sort_by == "progress":
+            self._resort_cards()
     
     def set_status(self, chapter_name: str, status: DownloadStatus):
         """Set download status for a chapter."""
         if chapter_name in self._cards:
+            # Buffered progress belongs before the status change, not after it
+            self._flush_progress()
+            # The card's statusChanged refreshes the summary if this is a change
             self._cards[chapter_name].set_status(status)
-            self._update_status()
-            self._update_overall_progress()
     
     def mark_completed(self, chapter_name: str):
         """Mark a chapter download as completed."""
@@ -307,6 +308,21 @@ class DownloadsTab(QWidget):
         """Mark a chapter download as failed."""
         self.set_status(chapter_name, DownloadStatus.ERROR)
     
+    def _set_card_progress(self, chapter_name: str, card: DownloadCard):
+        """Update one card's share of the overall progress sum."""
+        value = 100 if card.status == DownloadStatus.COMPLETED else card._progress
+        self._progress_sum += value - self._card_progress.get(chapter_name, 0)
+        self._card_progress[chapter_name] = value
+    
+    def _on_card_status_changed(self, chapter_name: str, old: DownloadStatus, new: DownloadStatus):
+        """Move a card between status counts and refresh the summary."""
+        self._status_counts[old] -= 1
+        self._status_counts[new] += 1
+        if chapter_name in self._cards:
+            self._set_card_progress(chapter_name, self._cards[chapter_name])
+        self._update_status()
+        self._update_overall_progress()
+    
     def _on_cancel_requested(self, chapter_name: str):
         """Handle cancel request from a card."""
         self.cancelDownload.emit(chapter_name)
@@ -321,16 +337,16 @@ class DownloadsTab(QWidget):
     
     def _clear_completed(self):
         """Remove completed/error download cards."""
-        to_remove = []
-        for name, card in self._cards.items():
-            if card.status in (DownloadStatus.COMPLETED, DownloadStatus.ERROR, 
-                              DownloadStatus.CANCELLED):
-                to_remove.append(name)
-        
-        for name in to_remove:
-            card = self._cards.pop(name)
+        for name, card in list(self._cards.items()):
+            if card.status not in _FINISHED_STATUSES:
+                continue
+            del self._cards[name]
+            self._status_counts[card.status] -= 1
+            self._progress_sum -= self._card_progress.pop(name, 0)
             card.deleteLater()
         
+        self._card_order = [card for card in self._card_order if card.status not in _FINISHED_STATUSES]
+        
         # Show empty state if no cards left
         if not self._cards:
             self._empty_widget.show()
@@ -341,6 +357,12 @@ class DownloadsTab(QWidget):
     def _open_download_folder(self):
         """Open the download directory in file explorer."""
         settings = get_settings()
+        if self._resolved_for == settings.output_dir:
+            # Resolved and checked on an earlier click; re-check only if opening fails
+            if QDesktopServices.openUrl(QUrl.fromLocalFile(self._resolved_output_path)):
+                return
+            self.invalidate_path_cache()
+        
         path = settings.output_dir
         
         if not os.path.isabs(path):
@@ -354,22 +376,27 @@ class DownloadsTab(QWidget):
                 os.makedirs(path, exist_ok=True)
                 QDesktopServices.openUrl(QUrl.fromLocalFile(path))
             except Exception:
-                pass
+                return
+        
+        self._resolved_output_path = path
+        self._resolved_for = settings.output_dir
+    
+    def invalidate_path_cache(self):
+        """Forget the resolved download folder (e.g. after settings change)."""
+        self._resolved_output_path = None
+        self._resolved_for = None
     
     def _update_status(self):
         """Update the status label."""
-        active = sum(
-            1 for card in self._cards.values() 
-            if card.status in (DownloadStatus.QUEUED, DownloadStatus.DOWNLOADING)
-        )
-        completed = sum(
-            1 for card in self._cards.values()
-            if card.status == DownloadStatus.COMPLETED
-        )
-        failed = sum(
-            1 for card in self._cards.values()
-            if card.status == DownloadStatus.ERROR
-        )
+        counts = self._status_counts
+        active = counts[DownloadStatus.QUEUED] + counts[DownloadStatus.DOWNLOADING]
+        completed = counts[DownloadStatus.COMPLETED]
+        failed = counts[DownloadStatus.ERROR]
+        
+        key = (active, failed, completed)
+        if key == self._shown_status:
+            return
+        self._shown_status = key
         
         # Show/hide retry all button based on failed count
         if failed > 0:
@@ -392,22 +419,19 @@ class DownloadsTab(QWidget):
             self._overall_progress.setValue(0)
             return
         
-        total = len(self._cards)
-        completed_count = sum(
-            1 for card in self._cards.values()
-            if card.status == DownloadStatus.COMPLETED
-        )
-        
-        # Simple percentage based on completed downloads
-        if total > 0:
-            progress = int((completed_count / total) * 100)
-            self._overall_progress.setValue(progress)
+        # Average of every card's progress, counting completed ones as 100%
+        self._overall_progress.setValue(self._progress_sum // len(self._cards))
     
     def clear_all(self):
         """Clear all download cards."""
         for card in self._cards.values():
             card.deleteLater()
         self._cards.clear()
+        self._card_order = []
+        self._status_counts.clear()
+        self._card_progress.clear()
+        self._progress_sum = 0
+        self._pending_progress.clear()
         self._empty_widget.show()
         self._overall_progress.setValue(0)
         self._update_status()
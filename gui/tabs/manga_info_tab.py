@@ -14,7 +14,37 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from gui.theme import Colors, Spacing, Fonts
 from gui.components.animated_button import PrimaryButton, AnimatedButton
 from gui.components.manga_info_card import MangaInfoCard
-from gui.components.chapter_list import ChapterListWidget, ChapterItem
+from gui.components.chapter_list import ChapterListWidget
+
+_EMPTY_TEXT_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: {Fonts.SIZE_H2}px;
+    }}
+"""
+
+_EMPTY_HINT_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_MUTED};
+        font-size: {Fonts.SIZE_BODY}px;
+    }}
+"""
+
+_DOWNLOAD_FRAME_QSS = f"""
+    QFrame {{
+        background-color: {Colors.BG_MEDIUM};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_LG}px;
+        padding: {Spacing.MD}px;
+    }}
+"""
+
+_SELECTION_LABEL_QSS = f"""
+    QLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: {Fonts.SIZE_BODY}px;
+    }}
+"""
 
 
 class MangaInfoTab(QWidget):
@@ -27,6 +57,9 @@ class MangaInfoTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._manga_url = ""
+        self._content_widget: Optional[QWidget] = None  # Built by the first set_manga_info()
+        self._shown_selection_count = 0  # What the selection label and button reflect
+        self._info_signature: Optional[tuple] = None  # Arguments the info card was last filled from
         self._setup_ui()
     
     def _setup_ui(self):
@@ -47,27 +80,18 @@ class MangaInfoTab(QWidget):
         
         empty_text = QLabel("No manga loaded")
         empty_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_text.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: {Fonts.SIZE_H2}px;
-            }}
-        """)
+        empty_text.setStyleSheet(_EMPTY_TEXT_QSS)
         empty_layout.addWidget(empty_text)
         
         empty_hint = QLabel("Enter a URL in the first tab to get started")
         empty_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_hint.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        empty_hint.setStyleSheet(_EMPTY_HINT_QSS)
         empty_layout.addWidget(empty_hint)
         
         layout.addWidget(self._empty_widget)
-        
-        # Content widget (shown when manga is loaded)
+    
+    def _build_content_widget(self):
+        """Build the manga view the first time there is a manga to show."""
         self._content_widget = QWidget()
         self._content_widget.hide()
         content_layout = QVBoxLayout(self._content_widget)
@@ -91,29 +115,17 @@ class MangaInfoTab(QWidget):
         
         # Chapter list
         self._chapter_list = ChapterListWidget()
-        self._chapter_list.selectionChanged.connect(self._on_selection_changed)
+        self._chapter_list.selectionCountChanged.connect(self._on_selection_changed)
         content_layout.addWidget(self._chapter_list, 1)
         
         # Download section
         download_frame = QFrame()
-        download_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_MEDIUM};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_LG}px;
-                padding: {Spacing.MD}px;
-            }}
-        """)
+        download_frame.setStyleSheet(_DOWNLOAD_FRAME_QSS)
         download_layout = QHBoxLayout(download_frame)
         download_layout.setSpacing(Spacing.MD)
         
         self._selection_label = QLabel("0 chapters selected")
-        self._selection_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_SECONDARY};
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        self._selection_label.setStyleSheet(_SELECTION_LABEL_QSS)
         download_layout.addWidget(self._selection_label)
         
         download_layout.addStretch()
@@ -125,7 +137,7 @@ class MangaInfoTab(QWidget):
         
         content_layout.addWidget(download_frame)
         
-        layout.addWidget(self._content_widget)
+        self.layout().addWidget(self._content_widget)
     
     def set_manga_info(
         self,
@@ -140,28 +152,25 @@ class MangaInfoTab(QWidget):
     ):
         """Set manga information and display it."""
         self._manga_url = url
-        
-        # Update info card
-        self._info_card.set_manga_info(
-            title=title,
-            cover_url=cover_url,
-            cover_bytes=cover_data,
-            description=description,
-            metadata=metadata,
-            tags=tags
-        )
+        if self._content_widget is None:
+            self._build_content_widget()
+        
+        # Update info card, unless this is the manga it already shows
+        signature = (url, title, cover_url, bool(cover_data), description, metadata, tags)
+        if signature != self._info_signature:
+            self._info_signature = signature
+            self._info_card.set_manga_info(
+                title=title,
+                cover_url=cover_url,
+                cover_bytes=cover_data,
+                description=description,
+                metadata=metadata,
+                tags=tags
+            )
         
         # Update chapter list
         if chapters:
-            chapter_items = [
-                ChapterItem(
-                    name=ch.get("name", f"Chapter {i+1}"),
-                    url=ch.get("url", ""),
-                    index=i
-                )
-                for i, ch in enumerate(chapters)
-            ]
-            self._chapter_list.set_chapters(chapter_items)
+            self._chapter_list.set_chapter_dicts(chapters)
         else:
             self._chapter_list.clear_chapters()
         
@@ -172,15 +181,22 @@ class MangaInfoTab(QWidget):
     def clear(self):
         """Clear manga information and show empty state."""
         self._manga_url = ""
+        if self._content_widget is None:
+            return  # Nothing shown yet; the empty state is already up
+        self._info_signature = None
         self._info_card.clear()
         self._chapter_list.clear_chapters()
         self._content_widget.hide()
         self._empty_widget.show()
     
-    def _on_selection_changed(self, selected: List[ChapterItem]):
+    def _on_selection_changed(self, count: int):
         """Handle chapter selection change."""
-        count = len(selected)
-        self._selection_label.setText(f"{count} chapter{'s' if count != 1 else ''} selected")
+        if count == self._shown_selection_count:
+            return
+        self._shown_selection_count = count
+        self._selection_label.setText(
+            "1 chapter selected" if count == 1 else f"{count} chapters selected"
+        )
         self._download_btn.setEnabled(count > 0)
     
     def _on_download_clicked(self):
@@ -17,19 +17,62 @@ from gui.components.animated_button import AnimatedButton, PrimaryButton
 from gui.components.animated_input import PathInput
 from gui.config import get_settings, save_settings, reset_settings, SettingsManager
 
+# Styles every settings widget from the tab down, keyed on object names.
+# Section frames also reach the QFrame-based labels inside them.
+_SETTINGS_TAB_QSS = f"""
+    QFrame#settings-section, QFrame#settings-section QFrame {{
+        background-color: {Colors.BG_MEDIUM};
+        border: 1px solid {Colors.BORDER_DEFAULT};
+        border-radius: {Spacing.RADIUS_LG}px;
+    }}
+    QLabel#settings-section-title {{
+        color: {Colors.TEXT_PRIMARY};
+        font-family: {Fonts.FAMILY_DISPLAY};
+        font-size: {Fonts.SIZE_H3}px;
+        font-weight: bold;
+    }}
+    QLabel#settings-row-label {{
+        color: {Colors.TEXT_PRIMARY};
+        font-size: {Fonts.SIZE_BODY}px;
+        font-weight: 500;
+    }}
+    QLabel#settings-row-description {{
+        color: {Colors.TEXT_MUTED};
+        font-size: {Fonts.SIZE_SMALL}px;
+    }}
+    QLabel#settings-value {{
+        color: {Colors.NEON_CYAN};
+        font-weight: bold;
+        font-size: {Fonts.SIZE_BODY}px;
+    }}
+    QCheckBox {{
+        color: {Colors.TEXT_PRIMARY};
+        font-size: {Fonts.SIZE_BODY}px;
+        spacing: {Spacing.SM}px;
+    }}
+    QLabel#settings-hint {{
+        color: {Colors.TEXT_MUTED};
+        font-size: {Fonts.SIZE_SMALL}px;
+        margin-left: 24px;
+    }}
+    QScrollArea#settings-scroll {{
+        border: none;
+        background: transparent;
+    }}
+"""
+
+# Delay slider steps are tenths of a second; label text for every step
+_DELAY_SLIDER_MIN = 5
+_DELAY_SLIDER_MAX = 50
+_DELAY_TEXTS = tuple(f"{step / 10.0:.1f}s" for step in range(_DELAY_SLIDER_MIN, _DELAY_SLIDER_MAX + 1))
+
 
 class SettingsSection(QFrame):
     """A collapsible settings section with title."""
     
     def __init__(self, title: str, icon: str = "", parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_MEDIUM};
-                border: 1px solid {Colors.BORDER_DEFAULT};
-                border-radius: {Spacing.RADIUS_LG}px;
-            }}
-        """)
+        self.setObjectName("settings-section")
         
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(Spacing.LG, Spacing.LG, Spacing.LG, Spacing.LG)
@@ -37,14 +80,7 @@ class SettingsSection(QFrame):
         
         # Section title
         title_label = QLabel(f"{icon} {title}" if icon else title)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-family: {Fonts.FAMILY_DISPLAY};
-                font-size: {Fonts.SIZE_H3}px;
-                font-weight: bold;
-            }}
-        """)
+        title_label.setObjectName("settings-section-title")
         self._layout.addWidget(title_label)
     
     def add_widget(self, widget: QWidget):
@@ -68,24 +104,13 @@ class SettingsRow(QWidget):
         
         # Label
         self._label = QLabel(label)
-        self._label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {Fonts.SIZE_BODY}px;
-                font-weight: 500;
-            }}
-        """)
+        self._label.setObjectName("settings-row-label")
         layout.addWidget(self._label)
         
         # Description
         if description:
             desc = QLabel(description)
-            desc.setStyleSheet(f"""
-                QLabel {{
-                    color: {Colors.TEXT_MUTED};
-                    font-size: {Fonts.SIZE_SMALL}px;
-                }}
-            """)
+            desc.setObjectName("settings-row-description")
             desc.setWordWrap(True)
             layout.addWidget(desc)
         
@@ -113,6 +138,7 @@ class SettingsTab(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setStyleSheet(_SETTINGS_TAB_QSS)
         self._setup_ui()
         self._load_settings()
     
@@ -126,7 +152,7 @@ class SettingsTab(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll.setObjectName("settings-scroll")
         
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
@@ -155,18 +181,13 @@ class SettingsTab(QWidget):
         self._threads_slider.setMaximum(8)
         self._threads_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self._threads_slider.setTickInterval(1)
-        self._threads_slider.valueChanged.connect(self._on_threads_changed)
         threads_row.add_control(self._threads_slider)
         
         self._threads_label = QLabel("4")
         self._threads_label.setMinimumWidth(30)
-        self._threads_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.NEON_CYAN};
-                font-weight: bold;
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        self._threads_label.setObjectName("settings-value")
+        # Straight to QLabel's C++ slot, no Python handler per drag step
+        self._threads_slider.valueChanged.connect(self._threads_label.setNum)
         threads_row.add_control(self._threads_label)
         download_section.add_widget(threads_row)
         
@@ -180,18 +201,12 @@ class SettingsTab(QWidget):
         self._img_threads_slider.setMaximum(10)
         self._img_threads_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self._img_threads_slider.setTickInterval(1)
-        self._img_threads_slider.valueChanged.connect(self._on_img_threads_changed)
         img_threads_row.add_control(self._img_threads_slider)
         
         self._img_threads_label = QLabel("4")
         self._img_threads_label.setMinimumWidth(30)
-        self._img_threads_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.NEON_CYAN};
-                font-weight: bold;
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        self._img_threads_label.setObjectName("settings-value")
+        self._img_threads_slider.valueChanged.connect(self._img_threads_label.setNum)
         img_threads_row.add_control(self._img_threads_label)
         download_section.add_widget(img_threads_row)
         
@@ -201,21 +216,15 @@ class SettingsTab(QWidget):
             "Delay between requests in seconds (0.5-5.0)"
         )
         self._delay_slider = QSlider(Qt.Orientation.Horizontal)
-        self._delay_slider.setMinimum(5)  # 0.5 seconds
-        self._delay_slider.setMaximum(50)  # 5.0 seconds
+        self._delay_slider.setMinimum(_DELAY_SLIDER_MIN)  # 0.5 seconds
+        self._delay_slider.setMaximum(_DELAY_SLIDER_MAX)  # 5.0 seconds
         self._delay_slider.setTickInterval(5)
         self._delay_slider.valueChanged.connect(self._on_delay_changed)
         delay_row.add_control(self._delay_slider)
         
         self._delay_label = QLabel("1.0s")
         self._delay_label.setMinimumWidth(40)
-        self._delay_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.NEON_CYAN};
-                font-weight: bold;
-                font-size: {Fonts.SIZE_BODY}px;
-            }}
-        """)
+        self._delay_label.setObjectName("settings-value")
         delay_row.add_control(self._delay_label)
         download_section.add_widget(delay_row)
         
@@ -228,74 +237,27 @@ class SettingsTab(QWidget):
         
         # PDF conversion
         self._pdf_check = QCheckBox("Convert to PDF")
-        self._pdf_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {Fonts.SIZE_BODY}px;
-                spacing: {Spacing.SM}px;
-            }}
-        """)
         conversion_section.add_widget(self._pdf_check)
         
         # CBZ conversion  
         self._cbz_check = QCheckBox("Convert to CBZ (Comic Book Archive)")
-        self._cbz_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {Fonts.SIZE_BODY}px;
-                spacing: {Spacing.SM}px;
-            }}
-        """)
         conversion_section.add_widget(self._cbz_check)
         
         # EPUB conversion
         self._epub_check = QCheckBox("Convert to EPUB (Electronic Book)")
-        self._epub_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {Fonts.SIZE_BODY}px;
-                spacing: {Spacing.SM}px;
-            }}
-        """)
         conversion_section.add_widget(self._epub_check)
         
         # Merge chapters option
         self._merge_check = QCheckBox("Merge all chapters into single file")
-        self._merge_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {Fonts.SIZE_BODY}px;
-                spacing: {Spacing.SM}px;
-            }}
-        """)
         merge_hint = QLabel("Creates one PDF/CBZ/EPUB with all chapters instead of separate files")
-        merge_hint.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: {Fonts.SIZE_SMALL}px;
-                margin-left: 24px;
-            }}
-        """)
+        merge_hint.setObjectName("settings-hint")
         conversion_section.add_widget(self._merge_check)
         conversion_section.add_widget(merge_hint)
         
         # Delete images after conversion
         self._delete_check = QCheckBox("Delete images after conversion")
-        self._delete_check.setStyleSheet(f"""
-            QCheckBox {{
-                color: {Colors.TEXT_PRIMARY};
-                font-size: {Fonts.SIZE_BODY}px;
-                spacing: {Spacing.SM}px;
-            }}
-        """)
         delete_hint = QLabel("Only takes effect if PDF, CBZ, or EPUB conversion is enabled")
-        delete_hint.setStyleSheet(f"""
-            QLabel {{
-                color: {Colors.TEXT_MUTED};
-                font-size: {Fonts.SIZE_SMALL}px;
-                margin-left: 24px;
-            }}
-        """)
+        delete_hint.setObjectName("settings-hint")
         conversion_section.add_widget(self._delete_check)
         conversion_section.add_widget(delete_hint)
         
@@ -354,8 +316,9 @@ class SettingsTab(QWidget):
         settings.merge_chapters = self._merge_check.isChecked()
         settings.delete_images_after_conversion = self._delete_check.isChecked()
         
-        save_settings()
-        self.settingsChanged.emit()
+        # Unchanged settings aren't rewritten, and nothing needs to react to them
+        if save_settings():
+            self.settingsChanged.emit()
         
         QMessageBox.information(
             self, 
@@ -388,15 +351,6 @@ class SettingsTab(QWidget):
         if dir_path:
             self._output_dir.setText(dir_path)
     
-    def _on_threads_changed(self, value: int):
-        """Handle threads slider change."""
-        self._threads_label.setText(str(value))
-    
-    def _on_img_threads_changed(self, value: int):
-        """Handle image threads slider change."""
-        self._img_threads_label.setText(str(value))
-    
     def _on_delay_changed(self, value: int):
         """Handle delay slider change."""
-        delay = value / 10.0
-        self._delay_label.setText(f"{delay:.1f}s")
+        self._delay_label.setText(_DELAY_TEXTS[value - _DELAY_SLIDER_MIN])
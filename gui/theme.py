@@ -516,6 +516,98 @@ QComboBox QAbstractItemView {{
     selection-background-color: {Colors.NEON_CYAN};
 }}
 
+/* ==========================================================================
+   DOWNLOADS TAB
+   ========================================================================== */
+
+/* Also covers QFrame children (labels), as the old per-widget sheet did */
+QFrame#downloads-header, QFrame#downloads-header QFrame {{
+    background-color: {Colors.BG_MEDIUM};
+    border: 1px solid {Colors.BORDER_DEFAULT};
+    border-radius: {Spacing.RADIUS_LG}px;
+    padding: {Spacing.LG}px;
+}}
+
+QLabel#downloads-title {{
+    color: {Colors.TEXT_PRIMARY};
+    font-family: {Fonts.FAMILY_DISPLAY};
+    font-size: {Fonts.SIZE_H2}px;
+    font-weight: bold;
+}}
+
+QLabel#downloads-status {{
+    color: {Colors.TEXT_SECONDARY};
+    font-size: {Fonts.SIZE_BODY}px;
+}}
+
+QProgressBar#downloads-overall {{
+    background-color: {Colors.BG_LIGHT};
+    border: none;
+    border-radius: {Spacing.RADIUS_SM}px;
+    text-align: center;
+    color: {Colors.TEXT_PRIMARY};
+    font-weight: bold;
+    min-height: 24px;
+}}
+
+QProgressBar#downloads-overall::chunk {{
+    background: {Colors.GRADIENT_SUCCESS};
+    border-radius: {Spacing.RADIUS_SM}px;
+}}
+
+QLabel#downloads-sort-label {{
+    color: {Colors.TEXT_SECONDARY};
+    font-size: {Fonts.SIZE_SMALL}px;
+}}
+
+QComboBox#downloads-sort {{
+    background-color: {Colors.BG_LIGHT};
+    color: {Colors.TEXT_PRIMARY};
+    border: 1px solid {Colors.BORDER_DEFAULT};
+    border-radius: {Spacing.RADIUS_SM}px;
+    padding: {Spacing.SM}px {Spacing.MD}px;
+    font-size: {Fonts.SIZE_SMALL}px;
+    min-width: 120px;
+}}
+
+QComboBox#downloads-sort:hover {{
+    border-color: {Colors.NEON_CYAN};
+}}
+
+QComboBox#downloads-sort::drop-down {{
+    border: none;
+}}
+
+QComboBox#downloads-sort::down-arrow {{
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 6px solid {Colors.TEXT_SECONDARY};
+    margin-right: 8px;
+}}
+
+QComboBox#downloads-sort QAbstractItemView {{
+    background-color: {Colors.BG_MEDIUM};
+    color: {Colors.TEXT_PRIMARY};
+    selection-background-color: {Colors.NEON_CYAN};
+    selection-color: {Colors.BG_DARK};
+    border: 1px solid {Colors.BORDER_DEFAULT};
+}}
+
+QScrollArea#downloads-scroll {{
+    background-color: transparent;
+    border: none;
+}}
+
+QLabel#downloads-empty-icon {{
+    font-size: 48px;
+}}
+
+QLabel#downloads-empty-text {{
+    color: {Colors.TEXT_MUTED};
+    font-size: {Fonts.SIZE_BODY}px;
+}}
+
 /* ==========================================================================
    TOOLTIPS
    ========================================================================== */